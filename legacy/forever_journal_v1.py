@@ -24,12 +24,15 @@ Options:
 
 import datetime
 import calendar
+import functools
 import argparse
 import os
+import re
 import shutil
 import subprocess
 import sys
 import shlex
+import string
 
 # --- CONFIGURATION: JOURNAL SETTINGS ---
 START_YEAR = 2026
@@ -79,6 +82,20 @@ USABLE_H = ESTIMATED_TEXT_HEIGHT - HEADER_H - 2
 BLOCK_H = USABLE_H / NUM_YEARS
 
 
+# --- CONFIGURATION: TEST MODE ---
+# Content generated by --test (everything else is skipped, preserving page parity)
+TEST_MONTH_SUMMARIES = frozenset({2})  # Only Feb Summary
+TEST_YEAR_MONTH_SUMMARIES = frozenset({2})  # Only the one after Feb (YM1)
+TEST_DAILY = frozenset({
+    (2, 1), (2, 2), (2, 3), (2, 4),  # Feb 1-4
+    (2, 29),                         # Feb 29 (Leap check)
+    (6, 30),                         # Anniversary: June 30
+    (11, 29), (11, 30),              # Birthdays: Nov 29, 30
+    (12, 29), (12, 30), (12, 31),    # Dec 29-31
+})
+TEST_EXTRA_PAGES = frozenset({0, 1, 19, 20})  # First spread (0, 1) and Last page (19 or 20)
+
+
 # --- CONFIGURATION: SPECIAL DAYS ---
 SPECIAL_DAYS = {
     "annual": [
@@ -161,6 +178,22 @@ KANJI_DAYS = {
     "Sun": "日"
 }
 
+# Weekday abbreviations indexed by datetime.weekday() (0=Mon, 6=Sun)
+WEEKDAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Month names indexed by month number (index 0 is empty), resolved once at import
+MONTH_ABBR = tuple(calendar.month_abbr)
+MONTH_NAME = tuple(calendar.month_name)
+MONTH_NAME_UPPER = tuple(name.upper() for name in MONTH_NAME)
+
+# Days per month in a leap year (index 0 unused). The journal always lays out Feb 29.
+MONTH_LEN = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Rule parsing lookups ("3rd Mon Feb" -> weekday 0, month 2)
+MONTH_MAP = {m: i for i, m in enumerate(MONTH_ABBR) if m}
+DAY_MAP = {"Mon": 0, "Tue": 1, "Wed": 2, "Thu": 3, "Fri": 4, "Sat": 5, "Sun": 6}
+
+@functools.lru_cache(maxsize=None)
 def calculate_easter(year):
     """Calculates Western Easter date for a given year."""
     a = year % 19
@@ -179,6 +212,7 @@ def calculate_easter(year):
     day = ((h + l - 7 * m + 114) % 31) + 1
     return month, day
 
+@functools.lru_cache(maxsize=None)
 def calculate_election_day(year):
     """Calculates US Election Day (Tuesday after the first Monday in November)."""
     # Get 1st Monday of November (Month 11, Weekday 0)
@@ -186,22 +220,26 @@ def calculate_election_day(year):
     # Election Day is the next day (Tuesday)
     return 11, first_monday + 1
 
+@functools.lru_cache(maxsize=None)
 def get_nth_weekday_of_month(year, month, weekday_idx, n):
     """
     Returns the day of the month for the Nth occurrence of a weekday.
     weekday_idx: 0=Mon, 6=Sun
     n: 1 for 1st, 2 for 2nd, ... -1 for last
     """
-    cal = calendar.monthcalendar(year, month)
-    days = [week[weekday_idx] for week in cal if week[weekday_idx] != 0]
+    first_wd, last = calendar.monthrange(year, month)
     if n > 0:
-        if n <= len(days):
-            return days[n-1]
+        # Days from the 1st to the first matching weekday, then whole weeks
+        day = 1 + (weekday_idx - first_wd) % 7 + 7 * (n - 1)
     else:
-        if abs(n) <= len(days):
-            return days[n]
+        # Days back from the last day to the last matching weekday
+        last_wd = (first_wd + last - 1) % 7
+        day = last - (last_wd - weekday_idx) % 7 - 7 * (-n - 1)
+    if 1 <= day <= last:
+        return day
     return None
 
+@functools.lru_cache(maxsize=None)
 def parse_rule(rule, year):
     """Parses a rule string like '3rd Mon Feb' and returns (month, day)."""
     parts = rule.split()
@@ -215,13 +253,11 @@ def parse_rule(rule, year):
         nth_str, day_str, month_str = parts
         
         # Parse Month
-        month_map = {m: i for i, m in enumerate(calendar.month_abbr) if m}
-        month = month_map.get(month_str[:3].title())
+        month = MONTH_MAP.get(month_str[:3].title())
         if not month: return None, None
         
         # Parse Weekday
-        day_map = {"Mon": 0, "Tue": 1, "Wed": 2, "Thu": 3, "Fri": 4, "Sat": 5, "Sun": 6}
-        weekday = day_map.get(day_str[:3].title())
+        weekday = DAY_MAP.get(day_str[:3].title())
         if weekday is None: return None, None
         
         # Parse Nth
@@ -236,101 +272,74 @@ def parse_rule(rule, year):
         
     return None, None
 
-def get_special_events(year, month, day, use_whimsy=False):
-    events = []
-    
-    # Check Annual
-    for item in SPECIAL_DAYS["annual"]:
-        if "month" in item and "day" in item:
-            if item["month"] == month and item["day"] == day:
-                name = item["name"]
-                if use_whimsy and name in WHIMSY_STYLES:
-                    style = WHIMSY_STYLES[name]
-                    name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}"
-                events.append(name)
-        elif "rule" in item:
-            m, d = parse_rule(item["rule"], year)
-            if m == month and d == day:
-                name = item["name"]
-                if use_whimsy and name in WHIMSY_STYLES:
-                    style = WHIMSY_STYLES[name]
-                    name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}"
-                events.append(name)
-                
-    # Check Birthdays
-    for item in SPECIAL_DAYS["birthdays"]:
-        # Parse date "YYYY-MM-DD"
-        y_str, m_str, d_str = item["date"].split("-")
-        if int(m_str) == month and int(d_str) == day:
-            years_elapsed = year - int(y_str)
-            if years_elapsed >= 0:
-                name = item['name']
-                
-                if use_whimsy:
-                    style = WHIMSY_STYLES.get("Birthday")
-                    if style:
-                        name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}"
-                
-                events.append(f"{name} ({years_elapsed}y)")
-
-    # Check Anniversaries
-    for item in SPECIAL_DAYS["anniversaries"]:
-        # Parse date "YYYY-MM-DD"
-        y_str, m_str, d_str = item["date"].split("-")
-        if int(m_str) == month and int(d_str) == day:
-            years_elapsed = year - int(y_str)
-            if years_elapsed >= 0:
-                name = item['name']
-                
-                if use_whimsy:
-                    style = WHIMSY_STYLES.get("Anniversary")
-                    if style:
-                        name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}"
-                
-                events.append(f"{name} ({years_elapsed}y)")
-                
-    # Check Education
-    for item in SPECIAL_DAYS.get("education", []):
-        # Parse date "YYYY-MM-DD"
-        y_str, m_str, d_str = item["date"].split("-")
-        if int(m_str) == month and int(d_str) == day:
-            years_elapsed = year - int(y_str)
-            if years_elapsed >= 0:
-                name = item['name']
-                
-                if use_whimsy:
-                    style = WHIMSY_STYLES.get("Education")
-                    if style:
-                        name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}" 
-                
-                events.append(f"{name} ({years_elapsed}y)")
-
-    # Check Other
-    for item in SPECIAL_DAYS.get("other", []):
-        # Parse date "YYYY-MM-DD"
-        y_str, m_str, d_str = item["date"].split("-")
-        if int(m_str) == month and int(d_str) == day:
-            years_elapsed = year - int(y_str)
-            if years_elapsed >= 0:
-                name = item['name']
-                
-                if use_whimsy:
-                    style = WHIMSY_STYLES.get("Other")
-                    if style:
-                        name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}" 
-                
-                events.append(f"{name} ({years_elapsed}y)")
+# Dated (counting) categories and the whimsy style applied to each
+COUNTING_CATEGORIES = [
+    ("birthdays", "Birthday"),
+    ("anniversaries", "Anniversary"),
+    ("education", "Education"),
+    ("other", "Other"),
+]
 
-    return events
+def parse_counting_dates():
+    """Parses each counting item's "YYYY-MM-DD" date once into item["_ymd"] = (year, month, day)."""
+    for category, _ in COUNTING_CATEGORIES:
+        for item in SPECIAL_DAYS.get(category, []):
+            item["_ymd"] = tuple(int(part) for part in item["date"].split("-"))
 
+parse_counting_dates()
 
-def get_day_of_week(year, month, day):
-    """Returns the abbreviated day of the week (e.g., 'Mon') for a given date."""
-    try:
-        dt = datetime.date(year, month, day)
-        return dt.strftime("%a")
-    except ValueError:
-        return ""
+def build_special_index(start_year, num_years, use_whimsy=False):
+    """
+    Resolves every special day in the journal range once, up front.
+
+    Returns a dict keyed by (year, month, day) holding the list of formatted
+    event names for that date, in the same order the daily blocks print them
+    (annual holidays first, then each counting category).
+    """
+    events_by_ymd = {}
+    name_key = "whimsy" if use_whimsy else "plain"
+
+    for year in range(start_year, start_year + num_years):
+        # Annual: fixed dates and rules (resolved once per year)
+        for item in SPECIAL_DAYS["annual"]:
+            if "month" in item and "day" in item:
+                m, d = item["month"], item["day"]
+            elif "rule" in item:
+                m, d = parse_rule(item["rule"], year)
+                if m is None or d is None:
+                    continue
+            else:
+                continue
+            events_by_ymd.setdefault((year, m, d), []).append(item[name_key])
+
+        # Counting: birthdays, anniversaries, etc. show "(Ny)" since the original date
+        for category, _ in COUNTING_CATEGORIES:
+            for item in SPECIAL_DAYS.get(category, []):
+                ev_year, ev_month, ev_day = item["_ymd"]
+                years_elapsed = year - ev_year
+                if years_elapsed >= 0:
+                    name = item[name_key]
+                    events_by_ymd.setdefault((year, ev_month, ev_day), []).append(f"{name} ({years_elapsed}y)")
+
+    return events_by_ymd
+
+def build_weekday_table(start_year, num_years):
+    """
+    Computes the weekday (0=Mon, 6=Sun) of every date in the journal range in one pass.
+
+    Returns a dict keyed by (month, day) holding a tuple with one weekday per
+    journal year. Dates that do not exist in a given year (Feb 29) are None.
+    """
+    table = {}
+    for month in range(1, 13):
+        # Weekday of the 1st and month length for each year
+        starts = [calendar.monthrange(start_year + i, month) for i in range(num_years)]
+        for day in range(1, MONTH_LEN[month] + 1):
+            table[(month, day)] = tuple(
+                (first_wd + day - 1) % 7 if day <= last_day else None
+                for first_wd, last_day in starts
+            )
+    return table
 
 # --- WHIMSY CONFIGURATION ---
 WHIMSY_STYLES = {
@@ -360,6 +369,220 @@ WHIMSY_STYLES = {
     "Other": {"icon": r"\faGlobe", "color": "teal"},
 }
 
+def prepare_styles():
+    """
+    Pre-renders the display name of every special day once.
+
+    Sets item["plain"] to the bare name and item["whimsy"] to the name wrapped
+    in its WHIMSY_STYLES icon and color (annual items are styled by name,
+    counting items by category).
+    """
+    def styled(name, style):
+        if style:
+            return rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}"
+        return name
+
+    for item in SPECIAL_DAYS["annual"]:
+        item["plain"] = item["name"]
+        item["whimsy"] = styled(item["name"], WHIMSY_STYLES.get(item["name"]))
+
+    for category, style_key in COUNTING_CATEGORIES:
+        for item in SPECIAL_DAYS.get(category, []):
+            item["plain"] = item["name"]
+            item["whimsy"] = styled(item["name"], WHIMSY_STYLES.get(style_key))
+
+prepare_styles()
+
+# --- LATEX TEMPLATES ---
+# Document class, geometry, packages, colors and helper macros.
+# Geometry: footskip=5mm pushes footer up; with bottom=10mm, footer sits safely from edge.
+LATEX_PREAMBLE = string.Template(r"""
+\documentclass[10pt,twoside]{article}
+\usepackage[paperwidth=${page_w}mm, paperheight=${page_h}mm, inner=${inner}mm, outer=${outer}mm, top=${top}mm, bottom=${bottom}mm, footskip=5mm]{geometry}
+
+\usepackage{helvet}
+\renewcommand{\familydefault}{\sfdefault}
+\usepackage[cmyk]{xcolor}
+\usepackage{tikz}
+\usepackage{fancyhdr}
+\usepackage{listings} % For source code listing
+\usepackage{pdflscape} % For landscape pages
+\usepackage{multicol} % For multi-column layout
+\usepackage{fontawesome5} % For icons (whimsy mode)
+\usepackage{CJKutf8} % For Japanese Kanji
+\usepackage{graphicx} % For scaling text
+\usepackage{lastpage} % For total page count
+\usepackage{refcount} % For extracting page number values
+\usepackage[hidelinks]{hyperref} % For hyperlinks in PDF (loaded last)
+
+\pagestyle{fancy}
+\fancyhf{} % clear all headers and footers
+\renewcommand{\headrulewidth}{0pt}
+\fancyfoot[C]{\itshape \small \thepage} % Italic page number in center footer
+
+\setlength{\parindent}{0pt}
+\setlength{\parskip}{0pt}
+\raggedbottom % Prevent underfull vbox warnings and forced vertical stretching
+
+% Suppress minor layout warnings that spam the log and slow down compilation
+\hfuzz=10pt 
+\vfuzz=10pt
+\hbadness=10000
+
+\makeatletter
+\newcommand{\eventlistrow}[1]{%
+  \@ifundefined{r@sec:event_list_#1}{}{%
+    \hyperref[sec:event_list_#1]{Event List #1} & \pageref{sec:event_list_#1} \\%
+  }%
+}
+\makeatother
+
+% Helper component to shrink text if it exceeds a maximum width
+\newcommand{\myfittext}[2]{%
+  \sbox0{#2}%
+  \ifdim\wd0>#1%
+    \resizebox{#1}{!}{\usebox0}%
+  \else%
+    \usebox0%
+  \fi%
+}
+
+% Color Definitions
+\definecolor{guidegray}{cmyk}{0,0,0,0.6} % Darker guide lines
+\definecolor{bordergray}{cmyk}{0,0,0,0.9} % Darker border lines
+\definecolor{textgray}{cmyk}{0,0,0,0.6}   % Date labels
+\definecolor{sundayred}{cmyk}{0,1,1,0} % Pure Red for Sundays
+
+% Code Listing Colors
+\definecolor{codegreen}{cmyk}{1,0,1,0.4}
+\definecolor{codegray}{cmyk}{0,0,0,0.5}
+\definecolor{codepurple}{cmyk}{0.29,1,0,0.18}
+\definecolor{backcolour}{cmyk}{0,0,0.08,0.05}
+\definecolor{framegray}{cmyk}{0,0,0,0.1}
+
+\begin{document}
+\begin{CJK*}{UTF8}{min}
+\hfuzz=100pt 
+\vfuzz=100pt
+\hbadness=10000
+\vbadness=10000
+""")
+
+# Daily block TikZ fragments, filled with % formatting for every year block
+TPL_TIKZ_BEGIN = r"\begin{tikzpicture}[x=1mm, y=1mm, trim left=0mm, trim right=%.3fmm]" + "\n"
+TPL_BBOX = r"\path[use as bounding box] (0,0) rectangle (%.3f, %.3f);" + "\n"
+# (LABEL_Y_SHIFT is constant, so it is baked in rather than formatted per block)
+TPL_YEAR_LABEL = r"\node[anchor=%s, align=%s, inner sep=0pt, yshift=" + str(LABEL_Y_SHIFT) + r"mm] at (%.3f,%.3f) {%s \textbf{%s}};" + "\n"
+TPL_DAY_LABEL = r"\node[anchor=%s, align=%s, inner sep=0pt, yshift=" + str(LABEL_Y_SHIFT) + r"mm] at (%.3f,%.3f) {%s \color{%s} %s};" + "\n"
+TPL_KANJI_DAY = r"\scalebox{0.85}[1.0]{%s}"
+TPL_EVENTS = r"\node[anchor=west, inner sep=0, text=textgray, font=\footnotesize] at (%.3f, %.3f) {\myfittext{%.1fmm}{%s}};" + "\n"
+TPL_TOP_BORDER = r"\draw[bordergray] (0, %.3f) -- (%.3f, %.3f);" + "\n"
+TPL_BOTTOM_BORDER = r"\draw[bordergray] (0, 0) -- (%.3f, 0);" + "\n"
+TPL_CIRCLE = r"\draw[guidegray] (%.3f, %.3f) circle (%.3f);" + "\n"
+TPL_GUIDES_FULL = r"\foreach \y in {%s} {\draw[guidegray, dash pattern=on 0.5pt off 1pt] (0, \y) -- (%.3f, \y);}" + "\n"
+TPL_GUIDE_SHORT_R = r"\draw[guidegray, dash pattern=on 0.5pt off 1pt] (0, %.3f) -- (%.3f - %.3f, %.3f);" + "\n"
+TPL_GUIDE_SHORT_L = r"\draw[guidegray, dash pattern=on 0.5pt off 1pt] (%.3f, %.3f) -- (%.3f, %.3f);" + "\n"
+
+# Month summary: day number, year header and weekday abbreviation in each year cell
+TPL_SUMMARY_DAY_NUM = r"\node[anchor=center] at (%.3f, %.3f) {\small \textbf{%d}};" + "\n"
+TPL_SUMMARY_YEAR = r"\node[anchor=center] at (%.3f, %.3f) {\textbf{%d}};" + "\n"
+TPL_SUMMARY_DOW = r"\node[anchor=north west, inner sep=1pt] at (%.3f, %.3f) {\tiny %s %s};" + "\n"
+
+# Source code appendix: geometry reset (forces a new page), landscape section and listings setup.
+# The inner margin is kept for binding/hole punches; the 3 columns are unbalanced (multicols*)
+# to prevent LaTeX memory overflow on huge files.
+SOURCE_APPENDIX_BEGIN = string.Template(r"""\newgeometry{top=10mm, bottom=10mm, inner=${inner}mm, outer=10mm}
+\begin{landscape}
+\phantomsection
+\section*{Source Code: forever\_journal.py}
+\label{sec:source}
+\lstset{
+  language=Python,
+  basicstyle=\tiny\ttfamily,
+  keywordstyle=\color{blue},
+  stringstyle=\color{codepurple},
+  commentstyle=\color{codegreen},
+  breaklines=true,
+  showstringspaces=false,
+  numbers=none,
+  frame=single,
+  rulecolor=\color{lightgray}
+}
+\begin{multicols*}{3}
+\begin{lstlisting}
+""")
+# Split so this file's own listing never contains the literal end tag
+SOURCE_APPENDIX_END = r"\end{lst" + r"listing}" + "\n" + r"\end{multicols*}" + "\n" + r"\end{landscape}" + "\n"
+# Characters listings cannot typeset; written as <U+XXXX> in the appendix
+NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+# Title page: title, year range and the opening of the Special Days table
+# (two columns follow: Special Days on the left, Features & ToC on the right)
+TITLE_HEAD = string.Template(r"""\begin{titlepage}
+\phantomsection
+\label{sec:title}
+\centering
+{\Huge \textbf{Forever Journal} \par}
+\vspace{0.5cm}
+{\Large ${years_word} Years: ${start_year} -- ${end_year} \par}
+\vspace{1cm}
+\begin{minipage}[t]{0.48\textwidth}
+\hfuzz=100pt \hbadness=10000
+\vspace{0pt}
+\centering
+\setlength{\fboxsep}{3mm}
+\fbox{\begin{minipage}{0.95\linewidth}
+\hfuzz=100pt \hbadness=10000
+\centering
+\textbf{Special Days} \par \vspace{2mm}
+{\scriptsize
+\begin{tabular}{ll}
+\textbf{Holidays} & \textbf{Rule/Date} \\
+""")
+
+# Title page "Features" box
+TITLE_FEATURES = r"""\setlength{\fboxsep}{3mm}
+\fbox{\begin{minipage}{0.95\linewidth}
+\hfuzz=100pt \hbadness=10000
+\centering
+\textbf{Features} \par \vspace{2mm}
+{\small \itshape \raggedright
+\begin{itemize}
+\setlength\itemsep{-0.2em}
+\item Multi-year layout with $\sim$5 lines for daily writing starting/ending on years of your choice
+\item Fits a full decade on $\sim$100 sheets (4-day spread) enabling use of standard 25mm binders
+\item Dates and day of week pre-filled; continuation pages for long days
+\item Special days included (birthdays, etc.); Monthly and Yearly summary pages
+\item Edge index for months
+\item 2 daily circles for checkmarks, weather, etc.
+\item ``P arrow'' indicator to indicate daily entry continues on an ``Extra Page''
+\item Options for paper, lines, icons, Kanji
+\item Source code included in appendix
+\end{itemize}
+}
+\end{minipage}}
+"""
+
+# Title page info box (bottom of page), ends the titlepage environment
+TITLE_INFO_BOX = string.Template(r"""\begin{tikzpicture}[remember picture, overlay]
+  \node[anchor=south west, xshift=${inner}mm, yshift=${bottom}mm] at (current page.south west) {
+    \begin{minipage}{\textwidth}
+      \centering \ttfamily \scriptsize
+      \begin{tabular*}{\textwidth}{@{\extracolsep{\fill}} l l l l @{}}
+      Start Year: ${start_year} & Paper: ${paper} & Whimsy: ${whimsy} & Test Mode: ${test_mode} \\
+      Num Years: ${num_years} & Spread: ${spread} & Sundays Red: ${sundays_red} & Events: ${event_lists} \\
+      Lines/Day: ${lines} (${line_spacing}mm) & Align: ${align} & Kanji: ${kanji} & Source: ${source} \\
+      Volume/Day: ${volume} cm & ${thickness} & & \\
+      \end{tabular*}
+      \par \vspace{3mm}
+      \setlength{\fboxsep}{3mm}
+      \fbox{\parbox{\dimexpr\linewidth-2\fboxsep-2\fboxrule}{Command: ${command} \hfill Generated: ${generated}}}
+    \end{minipage}
+  };
+\end{tikzpicture}
+\end{titlepage}
+""")
+
 def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_compile=False, include_source=False, toc_enabled=False, whimsy=False, single_pass=False, event_lists_enabled=False, kanji_enabled=False, num_years=10, num_writing_lines=5):
     """
     Generates the LaTeX source file for the journal.
@@ -398,6 +621,25 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
     # Determine Days Per Page
     DAYS_PER_PAGE = 2 if spread_mode == "4up" else 1
 
+    # LaTeX output is collected in memory and written to disk as UTF-8 in large chunks
+    buf = []
+    emit = buf.append
+
+    def flush(out):
+        """Encodes the buffered LaTeX and writes it to the (binary) output file."""
+        out.write("".join(buf).encode("utf-8"))
+        buf.clear()
+
+    # Resolve all special days for the journal range once (O(1) lookup per day),
+    # already joined and LaTeX-escaped for the daily blocks
+    event_text_by_ymd = {
+        ymd: ", ".join(names).replace("&", r"\&")
+        for ymd, names in build_special_index(START_YEAR, NUM_YEARS, use_whimsy=whimsy).items()
+    }
+
+    # Weekday of every (month, day) for each journal year, computed in one pass
+    weekday_table = build_weekday_table(START_YEAR, NUM_YEARS)
+
     # Test Mode Logic
     # We define a helper to check if content should be generated based on context.
     # We also track physical pages to ensure parity alignment.
@@ -409,7 +651,7 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
 
     def draw_edge_index(month_idx):
         """Draws the edge index tab for the given month."""
-        month_name = calendar.month_name[month_idx].upper()
+        month_name = MONTH_NAME_UPPER[month_idx]
         
         # Calculate vertical position
         # Respect Top and Bottom Margins
@@ -426,7 +668,7 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
         current_physical_page = physical_page_count + 1
         is_odd = (current_physical_page % 2 != 0)
         
-        f.write(r"\begin{tikzpicture}[remember picture, overlay]" + "\n")
+        emit(r"\begin{tikzpicture}[remember picture, overlay]" + "\n")
         
         # Box Width: Leave 1mm gap between tab and text body
         # TARGET_MARGIN_OUTER is 6mm, so box is 5mm.
@@ -444,16 +686,16 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
             # We want to push text West. Node centers content.
             # Content = [Text + Spacer]. Center is shifted Right. Text is shifted Left (West).
             content = rf"\rotatebox{{-90}}{{\sffamily\bfseries\small {month_name}}}{spacer}"
-            f.write(rf"  \node[fill=black, text=white, anchor=north east, minimum width={box_width}mm, minimum height={segment_height}mm, yshift={y_shift}mm, inner sep=0pt] at (current page.north east) {{{content}}};" + "\n")
+            emit(rf"  \node[fill=black, text=white, anchor=north east, minimum width={box_width}mm, minimum height={segment_height}mm, yshift={y_shift}mm, inner sep=0pt] at (current page.north east) {{{content}}};" + "\n")
         else:
             # Left Page -> Left Edge (North West)
             # Text rotated 90 (Bottom to Top). Bottom of letters is East (Inner).
             # We want to push text East. Node centers content.
             # Content = [Spacer + Text]. Center is shifted Left. Text is shifted Right (East).
             content = rf"{spacer}\rotatebox{{90}}{{\sffamily\bfseries\small {month_name}}}"
-            f.write(rf"  \node[fill=black, text=white, anchor=north west, minimum width={box_width}mm, minimum height={segment_height}mm, yshift={y_shift}mm, inner sep=0pt] at (current page.north west) {{{content}}};" + "\n")
+            emit(rf"  \node[fill=black, text=white, anchor=north west, minimum width={box_width}mm, minimum height={segment_height}mm, yshift={y_shift}mm, inner sep=0pt] at (current page.north west) {{{content}}};" + "\n")
             
-        f.write(r"\end{tikzpicture}%" + "\n")
+        emit(r"\end{tikzpicture}%" + "\n")
 
     def render_event_list(event_list_num, width=None):
         """Renders an Event List column or page."""
@@ -466,73 +708,73 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
         is_even_page = (current_page_num % 2 == 0)
 
         # Header
-        f.write(rf"\begin{{minipage}}[t][{HEADER_H}mm]{{\textwidth}}\hfuzz=100pt\hbadness=10000\relax ")
+        emit(rf"\begin{{minipage}}[t][{HEADER_H}mm]{{\textwidth}}\hfuzz=100pt\hbadness=10000\relax ")
         
         header_text = rf"\huge \textbf{{Event List {event_list_num}}}"
         
         if is_even_page:
             # Left Page: Left Aligned
-            f.write(rf"{header_text} \hfill")
+            emit(rf"{header_text} \hfill")
         else:
             # Right Page: Right Aligned
-            f.write(rf"\hfill {header_text}")
+            emit(rf"\hfill {header_text}")
             
-        f.write(r"\end{minipage}")
-        f.write(r"\phantomsection" + "\n")
-        f.write(rf"\addcontentsline{{toc}}{{section}}{{Event List {event_list_num}}}")
-        f.write(rf"\label{{sec:event_list_{event_list_num}}}" + "\n")
-        f.write(r"\par \nointerlineskip")
+        emit(r"\end{minipage}")
+        emit(r"\phantomsection" + "\n")
+        emit(rf"\addcontentsline{{toc}}{{section}}{{Event List {event_list_num}}}")
+        emit(rf"\label{{sec:event_list_{event_list_num}}}" + "\n")
+        emit(r"\par \nointerlineskip")
 
         # 10 Year Blocks
-        for y_idx in range(NUM_YEARS):
-            curr_year = START_YEAR + y_idx
-            
-            f.write(rf"\begin{{tikzpicture}}[x=1mm, y=1mm, trim left=0mm, trim right={width}mm]" + "\n")
-            w = width
-            h = BLOCK_H
-            f.write(rf"\path[use as bounding box] (0,0) rectangle ({w}, {h});" + "\n")
-            
+        # Everything but the year label is the same in every block, so the block is
+        # formatted once and only the year is substituted per block
+        w = width
+        h = BLOCK_H
+        block_head = (
+            TPL_TIKZ_BEGIN % width
+            + TPL_BBOX % (w, h)
             # Year Label (Right aligned)
-            f.write(rf"\node[anchor=north east, align=right, inner sep=0pt, yshift={LABEL_Y_SHIFT}mm] at ({w},{h}) {{\textbf{{{curr_year}}}}};" + "\n")
-            
-            # Column Headers (Date | Event | Date | Event | Date | Event)
-            # 3 Groups
-            pair_w = w / 3
-            date_w = pair_w / 4
-            
-            # Group 1
-            f.write(rf"\node[anchor=north west, inner sep=1pt, font=\scriptsize\itshape] at (0, {h}) {{date}};" + "\n")
-            f.write(rf"\node[anchor=north west, inner sep=1pt, font=\scriptsize\itshape] at ({date_w}, {h}) {{event}};" + "\n")
-            
-            # Group 2
-            f.write(rf"\node[anchor=north west, inner sep=1pt, font=\scriptsize\itshape] at ({pair_w}, {h}) {{date}};" + "\n")
-            f.write(rf"\node[anchor=north west, inner sep=1pt, font=\scriptsize\itshape] at ({pair_w + date_w}, {h}) {{event}};" + "\n")
+            + rf"\node[anchor=north east, align=right, inner sep=0pt, yshift={LABEL_Y_SHIFT}mm] at ({w:.3f},{h:.3f}) {{\textbf{{%d}}}};" + "\n"
+        )
+
+        # Column Headers (Date | Event | Date | Event | Date | Event)
+        # 3 Groups
+        pair_w = w / 3
+        date_w = pair_w / 4
+
+        header_cols = (
+            (0, "date"), (date_w, "event"),                          # Group 1
+            (pair_w, "date"), (pair_w + date_w, "event"),            # Group 2
+            (2 * pair_w, "date"), (2 * pair_w + date_w, "event"),    # Group 3
+        )
+        block_headers = "".join(rf"\node[anchor=north west, inner sep=1pt, font=\scriptsize\itshape] at ({x:.3f}, {h:.3f}) {{{label}}};" + "\n" for x, label in header_cols)
+
+        # Vertical Dividers (Group 1/2 and Group 2/3 separators)
+        xs = ",".join(f"{x:.3f}" for x in (pair_w, 2 * pair_w))
+        # Writing Guidelines (one \foreach instead of a \draw per line)
+        line_spacing = h / NUM_WRITING_LINES
+        ys = ",".join(f"{h - l * line_spacing:.3f}" for l in range(1, NUM_WRITING_LINES))
+        block_guides = ""
+        if ys:
+            block_guides = rf"\foreach \y in {{{ys}}} {{\draw[guidegray, dash pattern=on 0.5pt off 1pt] (0, \y) -- ({w:.3f}, \y);}}" + "\n"
+        block_tail = (
+            rf"\foreach \x in {{{xs}}} {{\draw[guidegray] (\x, 0) -- (\x, {h:.3f});}}" + "\n"
+            + block_guides
+            # Bottom Divider
+            + TPL_BOTTOM_BORDER % w
+            + r"\end{tikzpicture}" + "\n"
+            + r"\par \nointerlineskip" + "\n"
+        )
 
-            # Group 3
-            f.write(rf"\node[anchor=north west, inner sep=1pt, font=\scriptsize\itshape] at ({2 * pair_w}, {h}) {{date}};" + "\n")
-            f.write(rf"\node[anchor=north west, inner sep=1pt, font=\scriptsize\itshape] at ({2 * pair_w + date_w}, {h}) {{event}};" + "\n")
+        for y_idx in range(NUM_YEARS):
+            emit(block_head % (START_YEAR + y_idx))
+            emit(block_headers)
 
             # Top Border (First block only)
             if y_idx == 0:
-                f.write(rf"\draw[bordergray] (0, {h}) -- ({w}, {h});" + "\n")
-            
-            # Vertical Dividers
-            # Group 1/2 separator
-            f.write(rf"\draw[guidegray] ({pair_w}, 0) -- ({pair_w}, {h});" + "\n")
-            
-            # Group 2/3 separator
-            f.write(rf"\draw[guidegray] ({2 * pair_w}, 0) -- ({2 * pair_w}, {h});" + "\n")
-            
-            # Writing Guidelines
-            line_spacing = h / NUM_WRITING_LINES
-            for l in range(1, NUM_WRITING_LINES):
-                y_pos = h - l * line_spacing
-                f.write(rf"\draw[guidegray, dash pattern=on 0.5pt off 1pt] (0, {y_pos}) -- ({w}, {y_pos});" + "\n")
+                emit(TPL_TOP_BORDER % (h, w, h))
 
-            # Bottom Divider
-            f.write(rf"\draw[bordergray] (0, 0) -- ({w}, 0);" + "\n")
-            f.write(r"\end{tikzpicture}" + "\n")
-            f.write(r"\par \nointerlineskip" + "\n")
+            emit(block_tail)
 
     def ensure_parity(logical_page_num):
         """
@@ -540,7 +782,6 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
         does not match the even/odd parity of the target logical page number.
         """
         nonlocal physical_page_count
-        nonlocal event_list_counter
         
         # Parity: 1 = Odd, 0 = Even
         target_parity = logical_page_num % 2
@@ -549,10 +790,15 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
         if target_parity != next_physical_parity:
             # Always render a blank page for parity correction
             # Event Lists are now exclusively in the appendix if enabled
-            f.write(r"\null\newpage" + "\n")
+            emit(r"\null\newpage" + "\n")
             
             physical_page_count += 1
 
+    def start_page(logical_page_num):
+        """Moves to a physical page of the right parity and sets its page number."""
+        ensure_parity(logical_page_num)
+        emit(rf"\setcounter{{page}}{{{logical_page_num}}}" + "\n")
+
     def is_test_content(section, month=None, day=None, page_idx=None):
         if not test_mode:
             return True
@@ -561,42 +807,17 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
             return True
         
         if section == "MONTH_SUMMARY":
-            # Only Feb Summary
-            return month == 2
-            
+            return month in TEST_MONTH_SUMMARIES
+
         if section == "DAILY":
-            if month == 2:
-                # Feb 1-4
-                if day in [1, 2, 3, 4]:
-                    return True
-                # Feb 29 (Leap check)
-                if day == 29:
-                    return True
-            
-            # Anniversary: June 30
-            if month == 6 and day == 30:
-                return True
-                
-            # Birthdays: Nov 29, 30
-            if month == 11 and day in [29, 30]:
-                return True
-
-            if month == 12:
-                # Dec 29-31
-                if day in [29, 30, 31]:
-                    return True
-            return False
-            
+            return (month, day) in TEST_DAILY
+
         if section == "YEAR_MONTH_SUMMARY":
-            # Only the one after Feb (YM1)
-            return month == 2
-            
+            return month in TEST_YEAR_MONTH_SUMMARIES
+
         if section == "EXTRA_PAGES":
-            # First spread (0, 1) and Last page (19 or 20)
-            if page_idx in [0, 1, 19, 20]:
-                return True
-            return False
-            
+            return page_idx in TEST_EXTRA_PAGES
+
         if section == "SOURCE":
             return True
             
@@ -610,144 +831,44 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
     else:
         COL_WIDTH = CALC_TEXT_WIDTH - SAFETY_MARGIN
 
-    with open(output_tex, "w") as f:
+    with open(output_tex, "wb", buffering=1 << 20) as f:
         # --- PREAMBLE ---
-        f.write(r"""
-\documentclass[10pt,twoside]{article}
-""")
-        # Geometry setup:
-        # footskip=5mm pushes footer up; with bottom=10mm, footer sits safely from edge.
-        f.write(rf"\usepackage[paperwidth={PAGE_W}mm, paperheight={PAGE_H}mm, inner={TARGET_MARGIN_INNER}mm, outer={TARGET_MARGIN_OUTER}mm, top={TARGET_MARGIN_TOP}mm, bottom={TARGET_MARGIN_BOTTOM}mm, footskip=5mm]{{geometry}}" + "\n")
-
-        f.write(r"""
-\usepackage{helvet}
-\renewcommand{\familydefault}{\sfdefault}
-\usepackage[cmyk]{xcolor}
-\usepackage{tikz}
-\usepackage{fancyhdr}
-\usepackage{listings} % For source code listing
-\usepackage{pdflscape} % For landscape pages
-\usepackage{multicol} % For multi-column layout
-\usepackage{fontawesome5} % For icons (whimsy mode)
-\usepackage{CJKutf8} % For Japanese Kanji
-\usepackage{graphicx} % For scaling text
-\usepackage{lastpage} % For total page count
-\usepackage{refcount} % For extracting page number values
-\usepackage[hidelinks]{hyperref} % For hyperlinks in PDF (loaded last)
-
-\pagestyle{fancy}
-\fancyhf{} % clear all headers and footers
-\renewcommand{\headrulewidth}{0pt}
-\fancyfoot[C]{\itshape \small \thepage} % Italic page number in center footer
-
-\setlength{\parindent}{0pt}
-\setlength{\parskip}{0pt}
-\raggedbottom % Prevent underfull vbox warnings and forced vertical stretching
-
-% Suppress minor layout warnings that spam the log and slow down compilation
-\hfuzz=10pt 
-\vfuzz=10pt
-\hbadness=10000
-
-\makeatletter
-\newcommand{\eventlistrow}[1]{%
-  \@ifundefined{r@sec:event_list_#1}{}{%
-    \hyperref[sec:event_list_#1]{Event List #1} & \pageref{sec:event_list_#1} \\%
-  }%
-}
-\makeatother
-
-% Helper component to shrink text if it exceeds a maximum width
-\newcommand{\myfittext}[2]{%
-  \sbox0{#2}%
-  \ifdim\wd0>#1%
-    \resizebox{#1}{!}{\usebox0}%
-  \else%
-    \usebox0%
-  \fi%
-}
-
-% Color Definitions
-\definecolor{guidegray}{cmyk}{0,0,0,0.6} % Darker guide lines
-\definecolor{bordergray}{cmyk}{0,0,0,0.9} % Darker border lines
-\definecolor{textgray}{cmyk}{0,0,0,0.6}   % Date labels
-\definecolor{sundayred}{cmyk}{0,1,1,0} % Pure Red for Sundays
-
-% Code Listing Colors
-\definecolor{codegreen}{cmyk}{1,0,1,0.4}
-\definecolor{codegray}{cmyk}{0,0,0,0.5}
-\definecolor{codepurple}{cmyk}{0.29,1,0,0.18}
-\definecolor{backcolour}{cmyk}{0,0,0.08,0.05}
-\definecolor{framegray}{cmyk}{0,0,0,0.1}
-
-\begin{document}
-\begin{CJK*}{UTF8}{min}
-\hfuzz=100pt 
-\vfuzz=100pt
-\hbadness=10000
-\vbadness=10000
-""")
+        emit(LATEX_PREAMBLE.substitute(
+            page_w=PAGE_W, page_h=PAGE_H,
+            inner=TARGET_MARGIN_INNER, outer=TARGET_MARGIN_OUTER,
+            top=TARGET_MARGIN_TOP, bottom=TARGET_MARGIN_BOTTOM,
+        ))
 
         # --- COVER PAGE ---
         if is_test_content("TITLE"):
             ensure_parity(1)
-            f.write(r"\begin{titlepage}" + "\n")
-            f.write(r"\phantomsection" + "\n")
-            f.write(r"\label{sec:title}" + "\n")
-            f.write(r"\centering" + "\n")
-            
-            # Title at Top
-            f.write(r"{\Huge \textbf{Forever Journal} \par}" + "\n")
-            f.write(r"\vspace{0.5cm}" + "\n")
-            
             # Convert num years to word if simple integer
             num_words_map = {1:"One", 2:"Two", 3:"Three", 4:"Four", 5:"Five", 6:"Six", 7:"Seven", 8:"Eight", 9:"Nine", 10:"Ten", 11:"Eleven", 12:"Twelve"}
             num_years_word = num_words_map.get(NUM_YEARS, str(NUM_YEARS))
-            
-            f.write(rf"{{\Large {num_years_word} Years: {START_YEAR} -- {START_YEAR + NUM_YEARS - 1} \par}}" + "\n")
-            f.write(r"\vspace{1cm}" + "\n")
-            
-            # Two Columns: Special Days (Left) | Features & ToC (Right)
-            f.write(r"\begin{minipage}[t]{0.48\textwidth}" + "\n")
-            f.write(r"\hfuzz=100pt \hbadness=10000" + "\n")
-            f.write(r"\vspace{0pt}" + "\n")
-            f.write(r"\centering" + "\n")
-            f.write(r"\setlength{\fboxsep}{3mm}" + "\n") # Uniform padding
-            f.write(r"\fbox{\begin{minipage}{0.95\linewidth}" + "\n")
-            f.write(r"\hfuzz=100pt \hbadness=10000" + "\n")
-            f.write(r"\centering" + "\n")
-            f.write(r"\textbf{Special Days} \par \vspace{2mm}" + "\n")
-            f.write(r"{\scriptsize" + "\n")
-            f.write(r"\begin{tabular}{ll}" + "\n")
-            f.write(r"\textbf{Holidays} & \textbf{Rule/Date} \\" + "\n")
-            for item in SPECIAL_DAYS["annual"]:
-                name = item['name']
-                if whimsy and name in WHIMSY_STYLES:
-                    style = WHIMSY_STYLES[name]
-                    name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}"
 
+            emit(TITLE_HEAD.substitute(years_word=num_years_word, start_year=START_YEAR, end_year=START_YEAR + NUM_YEARS - 1))
+            name_key = "whimsy" if whimsy else "plain"
+
+            def rule_text(item):
                 if "rule" in item:
-                    rule = item["rule"]
-                else:
-                    rule = f"{calendar.month_abbr[item['month']]} {item['day']}"
-                f.write(rf"{name} & {rule} \\" + "\n")
+                    return item["rule"]
+                return f"{MONTH_ABBR[item['month']]} {item['day']}"
+
+            annual_rows = [rf"{item[name_key]} & {rule_text(item)} \\" + "\n" for item in SPECIAL_DAYS["annual"]]
+            emit("".join(annual_rows))
             
             # Birthdays
-            f.write(r"& \\" + "\n")
-            f.write(r"\textbf{Birthdays} & \textbf{Date} \\" + "\n")
+            emit(r"& \\" + "\n")
+            emit(r"\textbf{Birthdays} & \textbf{Date} \\" + "\n")
             
             # Sort Birthdays by Date Ascending
             sorted_birthdays = sorted(SPECIAL_DAYS["birthdays"], key=lambda x: x['date'])
             
             for item in sorted_birthdays:
-                name = item['name'].replace("&", r"\&")
-                if whimsy:
-                    style = WHIMSY_STYLES.get("Birthday")
-                    if style:
-                        name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}"
+                name = item[name_key].replace("&", r"\&")
                 
                 # Format Date: M D, Y
-                dt = datetime.datetime.strptime(item['date'], "%Y-%m-%d")
+                dt = datetime.date(*item["_ymd"])
                 
                 # Fixed width box for Month Abbreviation to ensure alignment
                 month_fixed = rf"\makebox[5mm][l]{{{dt.strftime('%b')}}}"
@@ -765,24 +886,20 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                 start_age = START_YEAR - born_year
                 end_age = start_age + num_years - 1
 
-                f.write(rf"{name} & {date_str} ({start_age}--{end_age}) \\" + "\n")
+                emit(rf"{name} & {date_str} ({start_age}--{end_age}) \\" + "\n")
 
             # Anniversaries
-            f.write(r"& \\" + "\n")
-            f.write(r"\textbf{Anniversaries} & \textbf{Date} \\" + "\n")
+            emit(r"& \\" + "\n")
+            emit(r"\textbf{Anniversaries} & \textbf{Date} \\" + "\n")
             
             # Sort Anniversaries by Date Ascending
             sorted_anniversaries = sorted(SPECIAL_DAYS["anniversaries"], key=lambda x: x['date'])
             
             for item in sorted_anniversaries:
-                name = item['name'].replace("&", r"\&")
-                if whimsy:
-                    style = WHIMSY_STYLES.get("Anniversary")
-                    if style:
-                        name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}" 
+                name = item[name_key].replace("&", r"\&")
                 
                 # Format Date: M D, Y
-                dt = datetime.datetime.strptime(item['date'], "%Y-%m-%d")
+                dt = datetime.date(*item["_ymd"])
 
                 # Fixed width box for Month Abbreviation to ensure alignment
                 month_fixed = rf"\makebox[4mm][l]{{{dt.strftime('%b')}}}"
@@ -800,24 +917,20 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                 start_ann = START_YEAR - ann_year
                 end_ann = start_ann + num_years - 1
 
-                f.write(rf"{name} & {date_str} ({start_ann}--{end_ann}) \\" + "\n")
+                emit(rf"{name} & {date_str} ({start_ann}--{end_ann}) \\" + "\n")
 
             # Education
-            f.write(r"& \\" + "\n")
-            f.write(r"\textbf{Education} & \textbf{Date} \\" + "\n")
+            emit(r"& \\" + "\n")
+            emit(r"\textbf{Education} & \textbf{Date} \\" + "\n")
             
             # Sort Education by Date Ascending
             sorted_education = sorted(SPECIAL_DAYS.get("education", []), key=lambda x: x['date'])
             
             for item in sorted_education:
-                name = item['name'].replace("&", r"\&")
-                if whimsy:
-                    style = WHIMSY_STYLES.get("Education")
-                    if style:
-                        name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}"
+                name = item[name_key].replace("&", r"\&")
                 
                 # Format Date: M D, Y
-                dt = datetime.datetime.strptime(item['date'], "%Y-%m-%d")
+                dt = datetime.date(*item["_ymd"])
                 
                 # Fixed width box for Month Abbreviation to ensure alignment
                 month_fixed = rf"\makebox[4mm][l]{{{dt.strftime('%b')}}}"
@@ -835,24 +948,20 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                 start_grad = START_YEAR - grad_year
                 end_grad = start_grad + num_years - 1
 
-                f.write(rf"{name} & {date_str} ({start_grad}--{end_grad}) \\" + "\n")
+                emit(rf"{name} & {date_str} ({start_grad}--{end_grad}) \\" + "\n")
 
             # Other
-            f.write(r"& \\" + "\n")
-            f.write(r"\textbf{Other} & \textbf{Date} \\" + "\n")
+            emit(r"& \\" + "\n")
+            emit(r"\textbf{Other} & \textbf{Date} \\" + "\n")
             
             # Sort Other by Date Ascending
             sorted_other = sorted(SPECIAL_DAYS.get("other", []), key=lambda x: x['date'])
             
             for item in sorted_other:
-                name = item['name'].replace("&", r"\&")
-                if whimsy:
-                    style = WHIMSY_STYLES.get("Other")
-                    if style:
-                         name = rf"\textcolor{{{style['color']}}}{{{style['icon']} \hspace{{1pt}} {name}}}"
+                name = item[name_key].replace("&", r"\&")
 
                 # Format Date: M D, Y
-                dt = datetime.datetime.strptime(item['date'], "%Y-%m-%d")
+                dt = datetime.date(*item["_ymd"])
                 
                 # Fixed width box for Month Abbreviation to ensure alignment
                 month_fixed = rf"\makebox[4mm][l]{{{dt.strftime('%b')}}}"
@@ -870,83 +979,62 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                 start_event = START_YEAR - event_year
                 end_event = start_event + num_years - 1
 
-                f.write(rf"{name} & {date_str} ({start_event}--{end_event}) \\" + "\n")
+                emit(rf"{name} & {date_str} ({start_event}--{end_event}) \\" + "\n")
 
-            f.write(r"\end{tabular}" + "\n")
-            f.write(r"}" + "\n")
-            f.write(r"\end{minipage}}" + "\n")
-            f.write(r"\end{minipage}%" + "\n")
+            emit(r"\end{tabular}" + "\n")
+            emit(r"}" + "\n")
+            emit(r"\end{minipage}}" + "\n")
+            emit(r"\end{minipage}%" + "\n")
             
-            f.write(r"\hfill" + "\n")
+            emit(r"\hfill" + "\n")
             
-            f.write(r"\begin{minipage}[t]{0.48\textwidth}" + "\n")
-            f.write(r"\hfuzz=100pt \hbadness=10000" + "\n")
-            f.write(r"\vspace{0pt}" + "\n")
-            f.write(r"\centering" + "\n")
+            emit(r"\begin{minipage}[t]{0.48\textwidth}" + "\n")
+            emit(r"\hfuzz=100pt \hbadness=10000" + "\n")
+            emit(r"\vspace{0pt}" + "\n")
+            emit(r"\centering" + "\n")
 
             if toc_enabled:
-                f.write(r"\setlength{\fboxsep}{3mm}" + "\n") # Uniform padding
-                f.write(r"\fbox{\begin{minipage}{0.95\linewidth}" + "\n")
-                f.write(r"\hfuzz=100pt \hbadness=10000" + "\n")
-                f.write(r"\centering" + "\n")
-                f.write(r"\small" + "\n") # Font size for table
-                f.write(r"\begin{tabular}{@{} l r @{}}" + "\n") # Use tabular for alignment, no side padding
-                f.write(r"\multicolumn{2}{c}{\textbf{Table of Contents}} \\[2mm]" + "\n")
-                f.write(r"\hyperref[sec:title]{Title Page} & \pageref{sec:title} \\" + "\n")
+                emit(r"\setlength{\fboxsep}{3mm}" + "\n") # Uniform padding
+                emit(r"\fbox{\begin{minipage}{0.95\linewidth}" + "\n")
+                emit(r"\hfuzz=100pt \hbadness=10000" + "\n")
+                emit(r"\centering" + "\n")
+                emit(r"\small" + "\n") # Font size for table
+                emit(r"\begin{tabular}{@{} l r @{}}" + "\n") # Use tabular for alignment, no side padding
+                emit(r"\multicolumn{2}{c}{\textbf{Table of Contents}} \\[2mm]" + "\n")
+                emit(r"\hyperref[sec:title]{Title Page} & \pageref{sec:title} \\" + "\n")
                 
                 # Add Yearly Summary
-                f.write(r"\hyperref[sec:yearly_summary]{Yearly Summary} & \pageref{sec:yearly_summary} \\" + "\n")
+                emit(r"\hyperref[sec:yearly_summary]{Yearly Summary} & \pageref{sec:yearly_summary} \\" + "\n")
 
-                for m in range(1, 13):
-                    m_name = calendar.month_name[m]
-                    if is_test_content("MONTH_SUMMARY", month=m):
-                        f.write(rf"\hyperref[sec:month_{m}]{{{m_name}}} & \pageref{{sec:month_{m}}} \\" + "\n")
-                    else:
-                        f.write(rf"{m_name} & (Skipped) \\" + "\n")
+                emit("".join(
+                    rf"\hyperref[sec:month_{m}]{{{MONTH_NAME[m]}}} & \pageref{{sec:month_{m}}} \\" + "\n"
+                    if is_test_content("MONTH_SUMMARY", month=m) else rf"{MONTH_NAME[m]} & (Skipped) \\" + "\n"
+                    for m in range(1, 13)
+                ))
                 
                 # Add Event Lists (Dynamic check)
-                for i in range(1, 15): # Check up to 15 potential event lists
-                    f.write(rf"\eventlistrow{{{i}}}" + "\n")
+                emit("".join(rf"\eventlistrow{{{i}}}" + "\n" for i in range(1, 15))) # Check up to 15 potential event lists
 
                 if not test_mode:
-                    f.write(r"\hyperref[sec:extra_pages]{Extra Pages} & \pageref{sec:extra_pages} \\" + "\n")
+                    emit(r"\hyperref[sec:extra_pages]{Extra Pages} & \pageref{sec:extra_pages} \\" + "\n")
                 else:
-                    f.write(r"Extra Pages & (Skipped) \\" + "\n")
+                    emit(r"Extra Pages & (Skipped) \\" + "\n")
                     
                 if include_source:
-                    f.write(r"\hyperref[sec:source]{Source Code} & \pageref{sec:source} \\" + "\n")
-                f.write(r"\end{tabular}" + "\n")
-                f.write(r"\end{minipage}}" + "\n")
-                f.write(r"\par" + "\n")
+                    emit(r"\hyperref[sec:source]{Source Code} & \pageref{sec:source} \\" + "\n")
+                emit(r"\end{tabular}" + "\n")
+                emit(r"\end{minipage}}" + "\n")
+                emit(r"\par" + "\n")
             
-            f.write(r"\vspace{20mm}" + "\n")
+            emit(r"\vspace{20mm}" + "\n")
 
             # -- FEATURES START --
-            f.write(r"\setlength{\fboxsep}{3mm}" + "\n") # Uniform padding
-            f.write(r"\fbox{\begin{minipage}{0.95\linewidth}" + "\n")
-            f.write(r"\hfuzz=100pt \hbadness=10000" + "\n")
-            f.write(r"\centering" + "\n")
-            f.write(r"\textbf{Features} \par \vspace{2mm}" + "\n")
-            f.write(r"{\small \itshape \raggedright" + "\n")
-            f.write(r"\begin{itemize}" + "\n")
-            f.write(r"\setlength\itemsep{-0.2em}" + "\n")
-            f.write(r"\item Multi-year layout with $\sim$5 lines for daily writing starting/ending on years of your choice" + "\n")
-            f.write(r"\item Fits a full decade on $\sim$100 sheets (4-day spread) enabling use of standard 25mm binders" + "\n")
-            f.write(r"\item Dates and day of week pre-filled; continuation pages for long days" + "\n")
-            f.write(r"\item Special days included (birthdays, etc.); Monthly and Yearly summary pages" + "\n")
-            f.write(r"\item Edge index for months" + "\n")
-            f.write(r"\item 2 daily circles for checkmarks, weather, etc." + "\n")
-            f.write(r"\item ``P arrow'' indicator to indicate daily entry continues on an ``Extra Page''" + "\n")
-            f.write(r"\item Options for paper, lines, icons, Kanji" + "\n")
-            f.write(r"\item Source code included in appendix" + "\n")
-            f.write(r"\end{itemize}" + "\n")
-            f.write(r"}" + "\n")
-            f.write(r"\end{minipage}}" + "\n")
+            emit(TITLE_FEATURES)
             # -- FEATURES END --
 
-            f.write(r"\end{minipage}" + "\n")
+            emit(r"\end{minipage}" + "\n")
             
-            f.write(r"\vfill" + "\n")
+            emit(r"\vfill" + "\n")
 
             # Info Box at Bottom Right
             now_str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -967,49 +1055,31 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
             stat_col_width = (CALC_TEXT_WIDTH - COLUMN_GUTTER) / 2 if DAYS_PER_PAGE == 2 else CALC_TEXT_WIDTH
             stat_writing_vol_cm = (stat_col_width * NUM_WRITING_LINES) / 10 # mm to cm
 
-            f.write(r"\begin{tikzpicture}[remember picture, overlay]" + "\n")
-            f.write(rf"  \node[anchor=south west, xshift={TARGET_MARGIN_INNER}mm, yshift={TARGET_MARGIN_BOTTOM}mm] at (current page.south west) {{" + "\n")
-            f.write(r"    \begin{minipage}{\textwidth}" + "\n") # Full width
-            f.write(r"      \centering \ttfamily \scriptsize" + "\n") # Monospaced, scriptsize
-            f.write(r"      \begin{tabular*}{\textwidth}{@{\extracolsep{\fill}} l l l l @{}}" + "\n")
-            
-            # Row 1
-            f.write(rf"      Start Year: {START_YEAR} & Paper: {CURRENT_PAPER_KEY.replace('_', r'\_')} & Whimsy: {whimsy} & Test Mode: {test_mode} \\" + "\n")
-            # Row 2
-            f.write(rf"      Num Years: {NUM_YEARS} & Spread: {spread_mode} & Sundays Red: {SUNDAYS_RED} & Events: {event_lists_enabled} \\" + "\n")
-            # Row 3
-            f.write(rf"      Lines/Day: {NUM_WRITING_LINES} ({final_line_spacing:.2f}mm) & Align: {align_mode} & Kanji: {kanji_enabled} & Source: {include_source} \\" + "\n")
-            # Row 4
+            # Thickness estimate needs LastPage, which is only resolved with the ToC passes
             thick_str = ""
             if toc_enabled:
-                 thick_str = r"Thickness: \pgfmathparse{\getpagerefnumber{LastPage}*0.0463}\pgfmathprintnumber[fixed, precision=1]{\pgfmathresult} mm"
-            else:
-                 thick_str = ""
-            
-            f.write(rf"      Volume/Day: {stat_writing_vol_cm:.1f} cm & {thick_str} & & \\" + "\n") # Cols 3 and 4 empty
-
-            f.write(r"      \end{tabular*}" + "\n")
-            f.write(r"      \par \vspace{3mm}" + "\n")
-            f.write(r"      \setlength{\fboxsep}{3mm}" + "\n") # Uniform padding
-            f.write(r"      \fbox{\parbox{\dimexpr\linewidth-2\fboxsep-2\fboxrule}{Command: " + cmd_str_safe + r" \hfill Generated: " + now_str + r"}}" + "\n")
-            f.write(r"    \end{minipage}" + "\n")
-            f.write(r"  };" + "\n")
-            f.write(r"\end{tikzpicture}" + "\n")
-
-            f.write(r"\end{titlepage}" + "\n")
+                thick_str = r"Thickness: \pgfmathparse{\getpagerefnumber{LastPage}*0.0463}\pgfmathprintnumber[fixed, precision=1]{\pgfmathresult} mm"
+
+            emit(TITLE_INFO_BOX.substitute(
+                inner=TARGET_MARGIN_INNER, bottom=TARGET_MARGIN_BOTTOM,
+                start_year=START_YEAR, paper=CURRENT_PAPER_KEY.replace("_", r"\_"), whimsy=whimsy, test_mode=test_mode,
+                num_years=NUM_YEARS, spread=spread_mode, sundays_red=SUNDAYS_RED, event_lists=event_lists_enabled,
+                lines=NUM_WRITING_LINES, line_spacing=f"{final_line_spacing:.2f}", align=align_mode, kanji=kanji_enabled, source=include_source,
+                volume=f"{stat_writing_vol_cm:.1f}", thickness=thick_str,
+                command=cmd_str_safe, generated=now_str,
+            ))
             physical_page_count += 1
 
         # --- YEARLY SUMMARY (Page 2) ---
         if is_test_content("TITLE"): 
-            ensure_parity(2) # Ensure we are on an Even page (Left side)
-            f.write(rf"\setcounter{{page}}{{2}}" + "\n")
-            f.write(r"\phantomsection" + "\n")
-            f.write(r"\label{sec:yearly_summary}" + "\n")
+            start_page(2) # Ensure we are on an Even page (Left side)
+            emit(r"\phantomsection" + "\n")
+            emit(r"\label{sec:yearly_summary}" + "\n")
             
-            f.write(r"\begin{center}" + "\n")
-            f.write(r"{\Large \textbf{Yearly Summary}} \par" + "\n")
-            f.write(r"\end{center}" + "\n")
-            f.write(r"\vspace{3mm}" + "\n")
+            emit(r"\begin{center}" + "\n")
+            emit(r"{\Large \textbf{Yearly Summary}} \par" + "\n")
+            emit(r"\end{center}" + "\n")
+            emit(r"\vspace{3mm}" + "\n")
 
             # Prepare Data grouped by Month
             month_events = {m: [] for m in range(1, 13)}
@@ -1052,7 +1122,7 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
             # Helper to process other lists
             def add_dated_events(category_key, icon_key_default, priority):
                 for item in SPECIAL_DAYS.get(category_key, []):
-                    dt = datetime.datetime.strptime(item['date'], "%Y-%m-%d")
+                    dt = datetime.date(*item["_ymd"])
                     m = dt.month
                     d = dt.day
                     name = f"{item['name'].replace('&', r'\&')} ({dt.year})"
@@ -1092,7 +1162,7 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
             cell_h = usable_h / rows
             cell_w = CALC_TEXT_WIDTH / cols
             
-            f.write(rf"\begin{{tikzpicture}}[x=1mm, y=1mm]" + "\n")
+            emit(rf"\begin{{tikzpicture}}[x=1mm, y=1mm]" + "\n")
             
             # Draw Grid
             for r in range(rows):
@@ -1105,14 +1175,14 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                     y = - (r * cell_h)
                     
                     # Rectangle
-                    f.write(rf"\draw[bordergray] ({x}, {y}) rectangle ({x + cell_w}, {y - cell_h});" + "\n")
+                    emit(rf"\draw[bordergray] ({x}, {y}) rectangle ({x + cell_w}, {y - cell_h});" + "\n")
                     
                     # Content
                     m_idx = (r * 3) + c + 1
-                    m_name = calendar.month_name[m_idx]
+                    m_name = MONTH_NAME[m_idx]
                     
                     # Month Header Node
-                    f.write(rf"\node[anchor=north west, font=\large\bfseries] at ({x + 2}, {y - 2}) {{{m_name}}};" + "\n")
+                    emit(rf"\node[anchor=north west, font=\large\bfseries] at ({x + 2}, {y - 2}) {{{m_name}}};" + "\n")
                     
                     # Text Node - Anchored below header
                     # Width = cell_w - padding
@@ -1121,17 +1191,17 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                     text_h = cell_h - 10
                     
                     # Minipage for content
-                    f.write(rf"\node[anchor=north west, inner sep=2mm] at ({x}, {y - 8}) {{" + "\n")
-                    f.write(rf"  \begin{{minipage}}[t][{text_h}mm][t]{{{text_w}mm}}" + "\n")
-                    f.write(r"  \hfuzz=100pt \hbadness=10000" + "\n")
+                    emit(rf"\node[anchor=north west, inner sep=2mm] at ({x}, {y - 8}) {{" + "\n")
+                    emit(rf"  \begin{{minipage}}[t][{text_h}mm][t]{{{text_w}mm}}" + "\n")
+                    emit(r"  \hfuzz=100pt \hbadness=10000" + "\n")
                     
                     if month_events[m_idx]:
                         # Use direct boxes (makebox) instead of tabular to guarantee single-line behavior (no wrapping).
                         # Previous tabular approach with 'l' column theoretically shouldn't wrap, but users reported spilling.
                         # Explicit boxes give us full control.
                         
-                        f.write(r"    \large" + "\n")
-                        f.write(r"    \setlength{\parskip}{0pt}" + "\n") # Tight vertical spacing
+                        emit(r"    \large" + "\n")
+                        emit(r"    \setlength{\parskip}{0pt}" + "\n") # Tight vertical spacing
                         
                         # Calculate available width for the name
                         # We allocate specific widths for Day and Icon to align them visually
@@ -1159,31 +1229,33 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                                 rf"\myfittext{{{w_name:.1f}mm}}{{{name_str}}}"
                                 r"\par"
                             )
-                            f.write(f"    {line_cmd}\n")
+                            emit(f"    {line_cmd}\n")
                             
                         # Remove the table environment closure as we are not using it
-                        # f.write(r"    \end{tabular}" + "\n") is NOT needed.
+                        # emit(r"    \end{tabular}" + "\n") is NOT needed.
 
                     
-                    f.write(r"  \end{minipage}" + "\n")
-                    f.write(r"};" + "\n")
+                    emit(r"  \end{minipage}" + "\n")
+                    emit(r"};" + "\n")
 
-            f.write(r"\end{tikzpicture}" + "\n")
+            emit(r"\end{tikzpicture}" + "\n")
 
             physical_page_count += 1
-            f.write(r"\newpage" + "\n")
-
-        # We need a reference leap year to ensure we iterate through Feb 29.
-        ref_year = START_YEAR
-        while not calendar.isleap(ref_year):
-            ref_year += 1
+            emit(r"\newpage" + "\n")
 
         page_num = 2  # Start on page 2 (Left) after title page
 
+        # Month summary weekday cells as (color command, two-letter abbreviation),
+        # indexed by weekday; None (Feb 29 in a non-leap year) stays blank
+        summary_dows = {None: ("", "")}
+        for wd, abbr in enumerate(WEEKDAY_ABBR):
+            dow = abbr[:2]
+            summary_dows[wd] = (r"\color{sundayred}" if dow == "Su" and SUNDAYS_RED else "", dow)
+
         def generate_month_summary(month, page_num):
             """Generates a 1-page summary for the month."""
-            month_name = calendar.month_name[month]
-            days_in_month = calendar.monthrange(ref_year, month)[1]
+            month_name = MONTH_NAME[month]
+            days_in_month = MONTH_LEN[month]
             
             # Layout Constants
             ROW_H = 8 # mm
@@ -1200,21 +1272,20 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                     ensure_parity(page_num + 1) # Force skip to Odd
                     page_num += 1
                 
-                ensure_parity(page_num)
-                f.write(rf"\setcounter{{page}}{{{page_num}}}" + "\n")
-                f.write(r"\phantomsection" + "\n")
-                f.write(rf"\label{{sec:month_{month}}}" + "\n")
+                start_page(page_num)
+                emit(r"\phantomsection" + "\n")
+                emit(rf"\label{{sec:month_{month}}}" + "\n")
                 
-                f.write(r"\begin{center}" + "\n")
-                f.write(rf"{{\Large \textbf{{{month_name} Summary}}}}" + "\n")
-                f.write(r"\end{center}" + "\n")
+                emit(r"\begin{center}" + "\n")
+                emit(rf"{{\Large \textbf{{{month_name} Summary}}}}" + "\n")
+                emit(r"\end{center}" + "\n")
                 
-                f.write(r"\vspace{5mm}" + "\n")
+                emit(r"\vspace{5mm}" + "\n")
                 
                 # TikZ Grid
                 grid_h = (days_in_month + 1) * ROW_H
                 
-                f.write(rf"\begin{{tikzpicture}}[x=1mm, y=1mm]" + "\n")
+                emit(rf"\begin{{tikzpicture}}[x=1mm, y=1mm]" + "\n")
                 
                 w = DAY_NUM_W + NUM_YEARS * YEAR_COL_W
                 
@@ -1225,45 +1296,40 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                 grid_right = w
 
                 # Draw Horizontal Lines (Only for Day rows)
-                for d in range(1, days_in_month + 2):
-                    y = grid_h - (d * ROW_H)
-                    f.write(rf"\draw[bordergray] ({grid_left}, {y}) -- ({grid_right}, {y});" + "\n")
+                ys = ",".join(f"{grid_h - (d * ROW_H):.3f}" for d in range(1, days_in_month + 2))
+                emit(rf"\foreach \y in {{{ys}}} {{\draw[bordergray] ({grid_left:.3f}, \y) -- ({grid_right:.3f}, \y);}}" + "\n")
                     
                 # Draw Vertical Lines (Only for Year columns)
-                for i in range(NUM_YEARS + 1):
-                    x = grid_left + (i * YEAR_COL_W)
-                    f.write(rf"\draw[bordergray] ({x}, {grid_bottom}) -- ({x}, {grid_top});" + "\n")
+                xs = ",".join(f"{grid_left + (i * YEAR_COL_W):.3f}" for i in range(NUM_YEARS + 1))
+                emit(rf"\foreach \x in {{{xs}}} {{\draw[bordergray] (\x, {grid_bottom:.3f}) -- (\x, {grid_top:.3f});}}" + "\n")
 
                 # --- CONTENT ---
                 
                 # 1. Day Numbers (Column 0)
-                for day in range(1, days_in_month + 1):
-                    y_center = grid_h - (day * ROW_H) - (ROW_H / 2)
-                    f.write(rf"\node[anchor=center] at ({DAY_NUM_W/2}, {y_center}) {{\small \textbf{{{day}}}}};" + "\n")
+                emit("".join(TPL_SUMMARY_DAY_NUM % (DAY_NUM_W / 2, grid_h - (day * ROW_H) - (ROW_H / 2), day)
+                             for day in range(1, days_in_month + 1)))
                     
                 # 2. Year Headers (Row 0)
                 header_y = grid_h - (ROW_H / 2)
-                for i in range(NUM_YEARS):
-                    curr_year = START_YEAR + i
-                    header_x = DAY_NUM_W + (i * YEAR_COL_W) + (YEAR_COL_W / 2)
-                    f.write(rf"\node[anchor=center] at ({header_x}, {header_y}) {{\textbf{{{curr_year}}}}};" + "\n")
+                emit("".join(TPL_SUMMARY_YEAR % (DAY_NUM_W + (i * YEAR_COL_W) + (YEAR_COL_W / 2), header_y, START_YEAR + i)
+                             for i in range(NUM_YEARS)))
                     
                 # 3. Day Cells
+                # Feb 29 is left blank in non-leap years
+                cell_xs = [DAY_NUM_W + (i * YEAR_COL_W) + 1 for i in range(NUM_YEARS)]
+                cells = []
                 for day in range(1, days_in_month + 1):
-                    row_top_y = grid_h - (day * ROW_H)
-                    for i in range(NUM_YEARS):
-                        curr_year = START_YEAR + i
-                        col_left_x = DAY_NUM_W + (i * YEAR_COL_W)
-                        dow = get_day_of_week(curr_year, month, day)[:2]
-                        color_cmd = r"\color{sundayred}" if dow == "Su" and SUNDAYS_RED else ""
-                        f.write(rf"\node[anchor=north west, inner sep=1pt] at ({col_left_x + 1}, {row_top_y - 1}) {{\tiny {color_cmd} {dow}}};" + "\n")
-
-                f.write(r"\end{tikzpicture}" + "\n")
+                    cell_y = grid_h - (day * ROW_H) - 1
+                    for cell_x, wd in zip(cell_xs, weekday_table[(month, day)]):
+                        cells.append(TPL_SUMMARY_DOW % ((cell_x, cell_y) + summary_dows[wd]))
+                emit("".join(cells))
+
+                emit(r"\end{tikzpicture}" + "\n")
                 
                 # Draw Edge Index
                 draw_edge_index(month)
                 
-                f.write(r"\newpage" + "\n")
+                emit(r"\newpage" + "\n")
                 nonlocal physical_page_count
                 physical_page_count += 1
             
@@ -1272,11 +1338,177 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
         # Removed old render_event_list definition as it is now defined earlier
 
 
+        # --- DAY BLOCK LAYOUT ---
+        # Geometry, fonts and guide lines of a year block depend only on the run
+        # configuration and the column alignment, so they are formatted once here.
+        CONTENT_WIDTH = COL_WIDTH - 3.0 # Extra slack to prevent Overfull \hbox
+        block_w = CONTENT_WIDTH
+        block_h = BLOCK_H
+        block_begin = r"\noindent" + TPL_TIKZ_BEGIN % CONTENT_WIDTH + TPL_BBOX % (block_w, block_h)
+        block_top_border = TPL_TOP_BORDER % (block_h, block_w, block_h)
+        block_end = TPL_BOTTOM_BORDER % block_w + r"\end{tikzpicture}" + "\n" + r"\par \nointerlineskip" + "\n"
+
+        line_spacing = block_h / NUM_WRITING_LINES
+        circle_radius = line_spacing * 0.35
+
+        # Dynamic Font Sizing based on line spacing (mm)
+        # 1mm ~= 2.83pt. We use a factor to make the text fill the line height.
+        # Factor 2.2 results in ~12pt font for 5.5mm line spacing.
+        fs_mm_factor = 2.2
+        fs_year_pt = line_spacing * fs_mm_factor
+        fs_day_pt = line_spacing * fs_mm_factor * 0.9 # Day slightly smaller/lighter
+        fs_p_pt = line_spacing * fs_mm_factor * 0.9 
+        
+        font_year = rf"\fontsize{{{fs_year_pt:.1f}}}{{{fs_year_pt*1.2:.1f}}}\selectfont"
+        font_day = rf"\fontsize{{{fs_day_pt:.1f}}}{{{fs_day_pt*1.2:.1f}}}\selectfont"
+        font_p = rf"\fontsize{{{fs_p_pt:.1f}}}{{{fs_p_pt*1.2:.1f}}}\selectfont"
+
+        # Split Year and Day into separate nodes to align precisely with the first two writing lines
+        year_y = block_h
+        day_y = block_h - line_spacing
+        y_text = block_h - 0.5 * line_spacing
+        guide_gap = YEAR_LABEL_WIDTH + 1
+
+        # align_right -> (event text x, event text width, circles + 'p' prompt + guide lines).
+        # The guide-line TikZ is identical for every block, so it is defined once as a
+        # macro per alignment and each block only invokes it.
+        block_layout = {}
+        for align_right in (False, True):
+            if align_right:
+                # Circles and event text on Left (Inner edge); text starts after the circle
+                cx = circle_radius + 1
+                x_text = (circle_radius + 1) + circle_radius + 1
+            else:
+                # Circles on Right (Inner edge); event text on Right after the label
+                cx = block_w - circle_radius - 1
+                x_text = guide_gap + 1
+            avail_w = CONTENT_WIDTH - x_text - 1.0
+
+            # Circles for first two lines (Inside end)
+            guide_parts = [TPL_CIRCLE % (cx, block_h - (s + 0.5) * line_spacing, circle_radius) for s in range(2)]
+
+            # Continuation 'p' prompt
+            # Anchor to bottom writing guide (y=0) to avoid touching top guide
+            guide_parts.append(rf"\node[anchor=south east, inner sep=0, text=textgray, yshift=0.5mm] at ({block_w:.3f}-8, 0) {{{font_p} $\vec{{p}}$}};" + "\n")
+
+            # Shortened Guide Lines (beside the labels)
+            for l in range(1, min(3, NUM_WRITING_LINES)):
+                y_pos = block_h - l * line_spacing
+                if align_right:
+                    guide_parts.append(TPL_GUIDE_SHORT_R % (y_pos, block_w, guide_gap, y_pos))
+                else:
+                    guide_parts.append(TPL_GUIDE_SHORT_L % (guide_gap, y_pos, block_w, y_pos))
+
+            # Full Guide Lines, as one \foreach
+            ys = ",".join(f"{block_h - l * line_spacing:.3f}" for l in range(3, NUM_WRITING_LINES))
+            if ys:
+                guide_parts.append(TPL_GUIDES_FULL % (ys, block_w))
+            guides_macro = r"\dayguidesright" if align_right else r"\dayguidesleft"
+            emit(rf"\newcommand{{{guides_macro}}}{{%" + "\n" + "".join(guide_parts) + "}\n")
+            block_layout[align_right] = (x_text, avail_w, guides_macro + "\n")
+
+        # (page parity, col_idx) -> (is_inner_col, align_right, block head template, event text x,
+        # event text width, block tail). Parity 0 = Even/Left page, 1 = Odd/Right.
+        # The head template opens the block and places the year/day labels; it is filled with
+        # (year, day color, day label). The tail holds the guide lines and closes the block.
+        # Even Page (Left): Col 0 = Outer, Col 1 = Inner
+        # Odd Page (Right): Col 0 = Inner, Col 1 = Outer
+        column_plans = {}
+        for parity in (0, 1):
+            for col_idx in range(DAYS_PER_PAGE):
+                is_inner_col = col_idx == (1 if parity == 0 else 0)
+                # Mirrored mode aligns labels to the outer (right) edge on Odd pages
+                align_right = align_mode == "mirrored" and parity == 1
+                if align_right:
+                    anchor, x_pos, align_txt = "north east", block_w, "right"
+                else:
+                    anchor, x_pos, align_txt = "north west", 0, "left"
+                x_text, avail_w, block_guides = block_layout[align_right]
+                block_head = (
+                    block_begin
+                    # Year Node (Line 1 space)
+                    + TPL_YEAR_LABEL % (anchor, align_txt, x_pos, year_y, font_year, "%s")
+                    # Day Node (Line 2 space)
+                    + TPL_DAY_LABEL % (anchor, align_txt, x_pos, day_y, font_day, "%s", "%s")
+                )
+                column_plans[(parity, col_idx)] = (is_inner_col, align_right, block_head, x_text, avail_w, block_guides + block_end)
+
+        # Opening of every day column minipage
+        column_begin = (
+            rf"\begin{{minipage}}[t]{{{COL_WIDTH:.3f}mm}}%" + "\n"
+            + r"\hfuzz=100pt \hbadness=10000" + "\n"
+            + r"\setlength{\parindent}{0pt}" + "\n"
+        )
+
+        # Weekday index -> (day color, day label) for the year blocks
+        day_labels = []
+        for weekday in WEEKDAY_ABBR:
+            label_day = weekday
+            if kanji_enabled:
+                kanji = KANJI_DAYS.get(weekday, "")
+                if kanji:
+                    label_day += " " + kanji
+                
+                # Squish all days to prevent wrapping and ensure visual consistency
+                label_day = TPL_KANJI_DAY % label_day
+
+            if SUNDAYS_RED and weekday == "Sun":
+                day_color = "sundayred"
+            else:
+                day_color = "textgray"
+            day_labels.append((day_color, label_day))
+
+        def render_year_blocks(month, day, weekdays, block_head, x_text, avail_w, block_tail):
+            """Returns the NUM_YEARS stacked year blocks of one day column."""
+            parts = []
+            for y_idx in range(NUM_YEARS):
+                curr_year = START_YEAR + y_idx
+                wd = weekdays[y_idx]
+
+                # --- DRAW THE BLOCK ---
+                # Only Feb 29 in a non-leap year has no weekday; its block stays empty
+                if wd is None:
+                    parts.append(block_begin)
+                    if y_idx == 0:
+                        parts.append(block_top_border)
+                    parts.append(block_end)
+                    continue
+
+                parts.append(block_head % ((curr_year,) + day_labels[wd]))
+
+                # Top Border (First block only)
+                if y_idx == 0:
+                    parts.append(block_top_border)
+
+                # Special Events Injection
+                event_str = event_text_by_ymd.get((curr_year, month, day))
+                if event_str:
+                    parts.append(TPL_EVENTS % (x_text, y_text, avail_w, event_str))
+
+                # Guide Lines and Bottom Divider
+                parts.append(block_tail)
+            return "".join(parts)
+
+        # Dates with an event in any journal year, and year blocks already rendered for
+        # event-free dates keyed by (page parity, col_idx, weekday pattern)
+        event_days = {(m, d) for _, m, d in event_text_by_ymd}
+        year_blocks_cache = {}
+
+        # Day-page chunks to render, keyed by (month, chunk start). In test mode a
+        # chunk is kept if any of its days is a test day.
+        render_set = set()
+        for m in range(1, 13):
+            m_days = MONTH_LEN[m]
+            for i in range(0, m_days, DAYS_PER_PAGE):
+                chunk_days = range(i + 1, min(i + 1 + DAYS_PER_PAGE, m_days + 1))
+                if not test_mode or any((m, d) in TEST_DAILY for d in chunk_days):
+                    render_set.add((m, i))
+
         # Iterate through months to ensure proper pagination (Start Month on Right/Odd Page)
         for month in range(1, 13):
             # Collect days for this month
             month_days = []
-            days_in_month = calendar.monthrange(ref_year, month)[1]
+            days_in_month = MONTH_LEN[month]
             for day in range(1, days_in_month + 1):
                 month_days.append((month, day))
 
@@ -1292,21 +1524,11 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                 chunk = month_days[i:i + DAYS_PER_PAGE]
                 
                 # Check if we should generate this page
-                is_chunk_test = False
-                if not test_mode:
-                    is_chunk_test = True
-                else:
-                    for _, d in chunk:
-                        if is_test_content("DAILY", month=month, day=d):
-                            is_chunk_test = True
-                            break
-                
-                if not is_chunk_test:
+                if (month, i) not in render_set:
                     page_num += 1
                     continue
 
-                ensure_parity(page_num)
-                f.write(rf"\setcounter{{page}}{{{page_num}}}" + "\n")
+                start_page(page_num)
 
                 # Check for Trailing Blank Column
                 has_blank_col = (len(chunk) == 1 and DAYS_PER_PAGE == 2)
@@ -1314,45 +1536,25 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                 for col_idx in range(DAYS_PER_PAGE):
                     # Separator between columns
                     if col_idx > 0:
-                        f.write(r"\hfill") # No newline to prevent space insertion
+                        emit(r"\hfill") # No newline to prevent space insertion
                     else:
-                        f.write(r"\noindent") 
+                        emit(r"\noindent") 
 
                     # Start Column Minipage
-                    f.write(rf"\begin{{minipage}}[t]{{{COL_WIDTH}mm}}%" + "\n")
-                    f.write(r"\hfuzz=100pt \hbadness=10000" + "\n")
-                    f.write(r"\setlength{\parindent}{0pt}" + "\n")
+                    emit(column_begin)
 
                     # Determine Content for this Column
                     if col_idx < len(chunk):
                         # Render Daily Content
                         month, day = chunk[col_idx]
-                        month_name = calendar.month_name[month].upper()
-
-                        # Determine Alignment for this column
-                        align_right = False
-
-                        # Determine if this is an Inner or Outer column
-                        # Even Page (Left): Col 0 = Outer, Col 1 = Inner
-                        # Odd Page (Right): Col 0 = Inner, Col 1 = Outer
-                        is_inner_col = False
-                        if page_num % 2 == 0:  # Even
-                            if col_idx == 1:
-                                is_inner_col = True
-                        else:  # Odd
-                            if col_idx == 0:
-                                is_inner_col = True
-
-                        if align_mode == "mirrored":
-                            if page_num % 2 != 0:  # Odd/Right Page
-                                align_right = True
-                            else:  # Even/Left Page
-                                align_right = False
-                        elif align_mode == "left":
-                            align_right = False
+                        month_name = MONTH_NAME_UPPER[month]
+
+                        # Alignment, inner/outer position and block layout for this column
+                        (is_inner_col, align_right, block_head,
+                         x_text, avail_w, block_tail) = column_plans[(page_num % 2, col_idx)]
 
                         # --- HEADER LOGIC ---
-                        f.write(rf"\begin{{minipage}}[t][{HEADER_H}mm]{{\textwidth}}\hfuzz=100pt\hbadness=10000\relax ")
+                        emit(rf"\begin{{minipage}}[t][{HEADER_H}mm]{{\textwidth}}\hfuzz=100pt\hbadness=10000\relax ")
 
                         # Determine content parts
                         day_str = rf"\huge \textbf{{{day}}}"
@@ -1370,174 +1572,62 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                         # Build the header line
                         if align_right:
                             # Labels on Right (Right Page in Mirrored Mode)
-                            f.write(r"\hfill ")
+                            emit(r"\hfill ")
                             if show_month:
-                                f.write(rf"{month_str} \quad ")
-                            f.write(rf"\makebox[{YEAR_LABEL_WIDTH}mm][r]{{{day_str}}}")
+                                emit(rf"{month_str} \quad ")
+                            emit(rf"\makebox[{YEAR_LABEL_WIDTH}mm][r]{{{day_str}}}")
                         else:
                             # Labels on Left (Left Page OR Left-Align Mode)
-                            f.write(rf"\makebox[{YEAR_LABEL_WIDTH}mm][l]{{{day_str}}}")
+                            emit(rf"\makebox[{YEAR_LABEL_WIDTH}mm][l]{{{day_str}}}")
                             
                             # Special Case: Left Align Mode on Odd (Right) Page
                             # User Request: Month name right-justified but offset by YEAR_LABEL_WIDTH
                             if align_mode == "left" and page_num % 2 != 0:
                                 if show_month:
-                                    f.write(r"\hfill ")
-                                    f.write(rf"{month_str} \makebox[{YEAR_LABEL_WIDTH}mm][r]{{}}")
+                                    emit(r"\hfill ")
+                                    emit(rf"{month_str} \makebox[{YEAR_LABEL_WIDTH}mm][r]{{}}")
                                 else:
-                                    f.write(r" \hfill")
+                                    emit(r" \hfill")
                             else:
                                 # Standard Left behavior
                                 if show_month:
-                                    f.write(rf" \quad {month_str}")
-                                f.write(r" \hfill")
+                                    emit(rf" \quad {month_str}")
+                                emit(r" \hfill")
 
-                        f.write(r"\end{minipage}")
-                        f.write(r"\par \nointerlineskip")
+                        emit(r"\end{minipage}")
+                        emit(r"\par \nointerlineskip")
 
                         # --- 10 YEAR BLOCKS ---
-                        for y_idx in range(NUM_YEARS):
-                            curr_year = START_YEAR + y_idx
-                            weekday = get_day_of_week(curr_year, month, day)
-
-                            is_leap_year = calendar.isleap(curr_year)
-                            is_feb_29 = (month == 2 and day == 29)
-                            skip_content = is_feb_29 and not is_leap_year
-
-                            if not skip_content:
-                                label_year = f"{curr_year}"
-                                label_day = f"{weekday}"
-                                
-                                if kanji_enabled:
-                                    kanji = KANJI_DAYS.get(weekday, "")
-                                    if kanji:
-                                        label_day += f" {kanji}"
-                                    
-                                    # Squish all days to prevent wrapping and ensure visual consistency
-                                    label_day = rf"\scalebox{{0.85}}[1.0]{{{label_day}}}"
-
-                                if SUNDAYS_RED and weekday == "Sun":
-                                    day_color = "sundayred"
-                                else:
-                                    day_color = "textgray"
-
-                            # --- DRAW THE BLOCK ---
-                            CONTENT_WIDTH = COL_WIDTH - 3.0 # Extra slack to prevent Overfull \hbox
-                            f.write(r"\noindent")
-                            f.write(rf"\begin{{tikzpicture}}[x=1mm, y=1mm, trim left=0mm, trim right={CONTENT_WIDTH}mm]" + "\n")
-
-                            w = CONTENT_WIDTH
-                            h = BLOCK_H
-
-                            f.write(rf"\path[use as bounding box] (0,0) rectangle ({w}, {h});" + "\n")
-
-                            line_spacing = h / NUM_WRITING_LINES
-                            circle_radius = line_spacing * 0.35
-
-                            # Dynamic Font Sizing based on line spacing (mm)
-                            # 1mm ~= 2.83pt. We use a factor to make the text fill the line height.
-                            # Factor 2.2 results in ~12pt font for 5.5mm line spacing.
-                            fs_mm_factor = 2.2
-                            fs_year_pt = line_spacing * fs_mm_factor
-                            fs_day_pt = line_spacing * fs_mm_factor * 0.9 # Day slightly smaller/lighter
-                            fs_p_pt = line_spacing * fs_mm_factor * 0.9 
-                            
-                            font_year = rf"\fontsize{{{fs_year_pt:.1f}}}{{{fs_year_pt*1.2:.1f}}}\selectfont"
-                            font_day = rf"\fontsize{{{fs_day_pt:.1f}}}{{{fs_day_pt*1.2:.1f}}}\selectfont"
-                            font_p = rf"\fontsize{{{fs_p_pt:.1f}}}{{{fs_p_pt*1.2:.1f}}}\selectfont"
-
-                            if not skip_content:
-                                # Split Year and Day into separate nodes to align precisely with the first two writing lines
-                                year_y = h
-                                day_y = h - line_spacing
-                                
-                                if align_right:
-                                    anchor = "north east"
-                                    x_pos = w
-                                    align_txt = "right"
-                                else:
-                                    anchor = "north west"
-                                    x_pos = 0
-                                    align_txt = "left"
-
-                                # Year Node (Line 1 space)
-                                f.write(rf"\node[anchor={anchor}, align={align_txt}, inner sep=0pt, yshift={LABEL_Y_SHIFT}mm] at ({x_pos},{year_y}) {{{font_year} \textbf{{{label_year}}}}};" + "\n")
-                                
-                                # Day Node (Line 2 space)
-                                f.write(rf"\node[anchor={anchor}, align={align_txt}, inner sep=0pt, yshift={LABEL_Y_SHIFT}mm] at ({x_pos},{day_y}) {{{font_day} \color{{{day_color}}} {label_day}}};" + "\n")
-
-                            # Top Border (First block only)
-                            if y_idx == 0:
-                                f.write(rf"\draw[bordergray] (0, {h}) -- ({w}, {h});" + "\n")
-
-                            # Guide Lines
-                            if not skip_content:
-                                guide_gap = YEAR_LABEL_WIDTH + 1
-
-                                # Special Events Injection
-                                events = get_special_events(curr_year, month, day, use_whimsy=whimsy)
-                                if events:
-                                    event_str = ", ".join(events)
-                                    event_str = event_str.replace("&", r"\&")
-                                    y_text = h - 0.5 * line_spacing
-                                    if align_right:
-                                        # Text on Left (Inner edge)
-                                        # Circle is at cx = circle_radius + 1
-                                        # Text should start after circle
-                                        x_text = (circle_radius + 1) + circle_radius + 1
-                                        avail_w = CONTENT_WIDTH - x_text - 1.0
-                                        f.write(rf"\node[anchor=west, inner sep=0, text=textgray, font=\footnotesize] at ({x_text}, {y_text}) {{\myfittext{{{avail_w:.1f}mm}}{{{event_str}}}}};" + "\n")
-                                    else:
-                                        # Text on Right (after label)
-                                        x_text = guide_gap + 1
-                                        avail_w = CONTENT_WIDTH - x_text - 1.0
-                                        f.write(rf"\node[anchor=west, inner sep=0, text=textgray, font=\footnotesize] at ({x_text}, {y_text}) {{\myfittext{{{avail_w:.1f}mm}}{{{event_str}}}}};" + "\n")
-
-                                # Circles for first two lines (Inside end)
-                                for s in range(2):  # First two spaces
-                                    y_circle = h - (s + 0.5) * line_spacing
-                                    if align_right:  # Inner is Left
-                                        cx = circle_radius + 1
-                                    else:  # Inner is Right
-                                        cx = w - circle_radius - 1
-                                    f.write(rf"\draw[guidegray] ({cx}, {y_circle}) circle ({circle_radius});" + "\n")
-
-                                # Continuation 'p' prompt
-                                # Anchor to bottom writing guide (y=0) to avoid touching top guide
-                                f.write(rf"\node[anchor=south east, inner sep=0, text=textgray, yshift=0.5mm] at ({w}-8, 0) {{{font_p} $\vec{{p}}$}};" + "\n")
-
-                                for l in range(1, NUM_WRITING_LINES):
-                                    y_pos = h - l * line_spacing
-                                    if l <= 2:
-                                        # Shortened Guide Line
-                                        if align_right:
-                                            f.write(rf"\draw[guidegray, dash pattern=on 0.5pt off 1pt] (0, {y_pos}) -- ({w} - {guide_gap}, {y_pos});" + "\n")
-                                        else:
-                                            f.write(rf"\draw[guidegray, dash pattern=on 0.5pt off 1pt] ({guide_gap}, {y_pos}) -- ({w}, {y_pos});" + "\n")
-                                    else:
-                                        f.write(rf"\draw[guidegray, dash pattern=on 0.5pt off 1pt] (0, {y_pos}) -- ({w}, {y_pos});" + "\n")
-
-                            # Bottom Divider
-                            f.write(rf"\draw[bordergray] (0, 0) -- ({w}, 0);" + "\n")
-
-                            f.write(r"\end{tikzpicture}" + "\n")
-                            f.write(r"\par \nointerlineskip" + "\n")
+                        weekdays = weekday_table[(month, day)]
+                        if (month, day) in event_days:
+                            emit(render_year_blocks(month, day, weekdays, block_head, x_text, avail_w, block_tail))
+                        else:
+                            # Without events the blocks depend only on the column and weekday pattern
+                            cache_key = (page_num % 2, col_idx, weekdays)
+                            year_blocks = year_blocks_cache.get(cache_key)
+                            if year_blocks is None:
+                                year_blocks = render_year_blocks(month, day, weekdays, block_head, x_text, avail_w, block_tail)
+                                year_blocks_cache[cache_key] = year_blocks
+                            emit(year_blocks)
                     
                     elif has_blank_col:
                         # Render Event List in the blank column -> CHANGED: Leave blank
-                        f.write(r"\hfill") # No newline to prevent space insertion
+                        emit(r"\hfill") # No newline to prevent space insertion
 
                     # End Column Minipage
-                    f.write(r"\end{minipage}") # No newline to prevent space insertion
+                    emit(r"\end{minipage}") # No newline to prevent space insertion
 
                 # Draw Edge Index
                 draw_edge_index(month)
 
                 # End of Page Chunk
-                f.write(r"\newpage%" + "\n")
+                emit(r"\newpage%" + "\n")
                 physical_page_count += 1
                 page_num += 1
 
+            # Write each finished month so the buffer stays bounded
+            flush(f)
+
         # --- EVENT LISTS APPENDIX ---
         if event_lists_enabled:
             # Ensure we start on an Odd (Right) page
@@ -1552,7 +1642,7 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                 # Render Full Page Event List
                 render_event_list(event_list_counter, width=CALC_TEXT_WIDTH)
                 event_list_counter += 1
-                f.write(r"\newpage" + "\n")
+                emit(r"\newpage" + "\n")
                 physical_page_count += 1
                 page_num += 1
 
@@ -1590,67 +1680,68 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
 
         num_lines_extra = int(EXTRA_USABLE_H / line_spacing)
 
-        for i in range(num_extra_pages):
-            if is_test_content("EXTRA_PAGES", page_idx=i):
-                ensure_parity(page_num)
-                f.write(rf"\setcounter{{page}}{{{page_num}}}" + "\n")
+        # Every extra-page column is identical, so it is defined once as a macro
+        col_parts = []
+        col_parts.append(rf"\begin{{minipage}}[t]{{{EXTRA_COL_WIDTH:.3f}mm}}%" + "\n")
+        col_parts.append(r"\hfuzz=100pt \hbadness=10000" + "\n")
+        
+        # TikZ for lines
+        col_parts.append(rf"\begin{{tikzpicture}}[x=1mm, y=1mm]" + "\n")
+        col_parts.append(rf"\path[use as bounding box] (0,0) rectangle ({EXTRA_COL_WIDTH:.3f}, {EXTRA_USABLE_H:.3f});" + "\n")
+        
+        # "date" annotation
+        # Top left of the column, above the writing area.
+        col_parts.append(rf"\node[anchor=south west, inner sep=0, text=textgray, yshift=0.5mm] at (0, {EXTRA_USABLE_H:.3f}) {{\small \textit{{date}}}};" + "\n")
+        
+        # Lines
+        # Top Border
+        col_parts.append(rf"\draw[bordergray] (0, {EXTRA_USABLE_H:.3f}) -- ({EXTRA_COL_WIDTH:.3f}, {EXTRA_USABLE_H:.3f});" + "\n")
+        
+        # Writing lines as one \foreach, then the bottom border for the last line
+        ys = ",".join(f"{EXTRA_USABLE_H - l * line_spacing:.3f}" for l in range(1, num_lines_extra))
+        if ys:
+            col_parts.append(TPL_GUIDES_FULL % (ys, EXTRA_COL_WIDTH))
+        if num_lines_extra:
+            y_pos = EXTRA_USABLE_H - num_lines_extra * line_spacing
+            col_parts.append(rf"\draw[bordergray] (0, {y_pos:.3f}) -- ({EXTRA_COL_WIDTH:.3f}, {y_pos:.3f});" + "\n")
+
+        col_parts.append(r"\end{tikzpicture}" + "\n")
+        col_parts.append(r"\end{minipage}") # no newline to avoid space insertion
+        emit(r"\newcommand{\extrapagecolumn}{" + "".join(col_parts) + "}\n")
+
+        # Which extra pages to render (all of them outside test mode)
+        render_extra = [is_test_content("EXTRA_PAGES", page_idx=i) for i in range(num_extra_pages)]
+
+        # Everything after the page start is the same on every extra page of a given
+        # parity, so the page body is built once per parity (0 = Even/Left, 1 = Odd/Right)
+        header_text = r"\huge \textbf{Extra Pages}"
+        extra_page_bodies = tuple(
+            # --- HEADER ---
+            rf"\begin{{minipage}}[t][{HEADER_H}mm]{{\textwidth}}\hfuzz=100pt\hbadness=10000\relax "
+            # Align based on page parity (Mirrored)
+            # Even (Left): Align Left
+            # Odd (Right): Align Right
+            + rf"\makebox[\textwidth][{'r' if parity else 'l'}]{{{header_text}}}"
+            + r"\end{minipage}"
+            + r"\par \nointerlineskip"
+            # Add spacing so "date" annotation doesn't overlap header
+            + rf"\vspace{{{line_spacing:.3f}mm}}" + "\n"
+            # --- COLUMNS ---
+            + r"\noindent" + "\n"
+            + r"\extrapagecolumn" + r"\hfill" + r"\extrapagecolumn"
+            + r"\newpage" + "\n"
+            for parity in (0, 1)
+        )
+
+        for i, render_page in enumerate(render_extra):
+            if render_page:
+                start_page(page_num)
                 
                 if i == 0:
-                    f.write(r"\phantomsection" + "\n")
-                    f.write(r"\label{sec:extra_pages}" + "\n")
-
-                # --- HEADER ---
-                f.write(rf"\begin{{minipage}}[t][{HEADER_H}mm]{{\textwidth}}\hfuzz=100pt\hbadness=10000\relax ")
-                
-                header_text = r"\huge \textbf{Extra Pages}"
-                
-                # Align based on page parity (Mirrored)
-                # Even (Left): Align Left
-                # Odd (Right): Align Right
-                if page_num % 2 == 0: # Even/Left
-                     f.write(rf"\makebox[\textwidth][l]{{{header_text}}}")
-                else: # Odd/Right
-                     f.write(rf"\makebox[\textwidth][r]{{{header_text}}}")
-
-                f.write(r"\end{minipage}")
-                f.write(r"\par \nointerlineskip")
-                
-                # Add spacing so "date" annotation doesn't overlap header
-                f.write(rf"\vspace{{{line_spacing}mm}}" + "\n")
-
-                # --- COLUMNS ---
-                f.write(r"\noindent" + "\n")
-                for col in range(2):
-                    if col > 0:
-                        f.write(r"\hfill") # no newline
-                        
-                    f.write(rf"\begin{{minipage}}[t]{{{EXTRA_COL_WIDTH}mm}}%" + "\n")
-                    f.write(r"\hfuzz=100pt \hbadness=10000" + "\n")
-                    
-                    # TikZ for lines
-                    f.write(rf"\begin{{tikzpicture}}[x=1mm, y=1mm]" + "\n")
-                    f.write(rf"\path[use as bounding box] (0,0) rectangle ({EXTRA_COL_WIDTH}, {EXTRA_USABLE_H});" + "\n")
-                    
-                    # "date" annotation
-                    # Top left of the column, above the writing area.
-                    f.write(rf"\node[anchor=south west, inner sep=0, text=textgray, yshift=0.5mm] at (0, {EXTRA_USABLE_H}) {{\small \textit{{date}}}};" + "\n")
-                    
-                    # Lines
-                    # Top Border
-                    f.write(rf"\draw[bordergray] (0, {EXTRA_USABLE_H}) -- ({EXTRA_COL_WIDTH}, {EXTRA_USABLE_H});" + "\n")
-                    
-                    for l in range(1, num_lines_extra + 1):
-                        y_pos = EXTRA_USABLE_H - l * line_spacing
-                        # Bottom border for the last line
-                        if l == num_lines_extra:
-                             f.write(rf"\draw[bordergray] (0, {y_pos}) -- ({EXTRA_COL_WIDTH}, {y_pos});" + "\n")
-                        else:
-                             f.write(rf"\draw[guidegray, dash pattern=on 0.5pt off 1pt] (0, {y_pos}) -- ({EXTRA_COL_WIDTH}, {y_pos});" + "\n")
+                    emit(r"\phantomsection" + "\n")
+                    emit(r"\label{sec:extra_pages}" + "\n")
 
-                    f.write(r"\end{tikzpicture}" + "\n")
-                    f.write(r"\end{minipage}") # no newline to avoid space insertion
-
-                f.write(r"\newpage" + "\n")
+                emit(extra_page_bodies[page_num % 2])
                 physical_page_count += 1
 
             page_num += 1
@@ -1663,61 +1754,27 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                 ensure_parity(page_num + 1) # Force skip to Odd
                 page_num += 1
             
-            ensure_parity(page_num)
             # Ensure the page number is correct (continuing from the last logical page)
-            f.write(rf"\setcounter{{page}}{{{page_num}}}" + "\n")
+            start_page(page_num)
             
-            # Reset geometry to maximize space for code (this forces a new page)
-            # Respect inner margin for binding/hole punches
-            f.write(rf"\newgeometry{{top=10mm, bottom=10mm, inner={TARGET_MARGIN_INNER}mm, outer=10mm}}" + "\n")
-            
-            # Landscape mode for source code
-            f.write(r"\begin{landscape}" + "\n")
-            f.write(r"\phantomsection" + "\n")
-            f.write(r"\section*{Source Code: forever\_journal.py}" + "\n")
-            f.write(r"\label{sec:source}" + "\n")
-            
-            # Configure listings
-            f.write(r"\lstset{" + "\n")
-            f.write(r"  language=Python," + "\n")
-            f.write(r"  basicstyle=\tiny\ttfamily," + "\n")
-            f.write(r"  keywordstyle=\color{blue}," + "\n")
-            f.write(r"  stringstyle=\color{codepurple}," + "\n")
-            f.write(r"  commentstyle=\color{codegreen}," + "\n")
-            f.write(r"  breaklines=true," + "\n")
-            f.write(r"  showstringspaces=false," + "\n")
-            f.write(r"  numbers=none," + "\n")
-            f.write(r"  frame=single," + "\n")
-            f.write(r"  rulecolor=\color{lightgray}" + "\n")
-            f.write(r"}" + "\n")
-            
-            # 3 Columns (Unbalanced to prevent LaTeX memory overflow on huge files)
-            f.write(r"\begin{multicols*}{3}" + "\n")
-            f.write(r"\begin{lstlisting}" + "\n")
+            # Reset geometry to maximize space for code, landscape, listings setup
+            emit(SOURCE_APPENDIX_BEGIN.substitute(inner=TARGET_MARGIN_INNER))
             
             # Read and write the source code of this file
             # We must be careful not to print the end-listing tag literally, or it will break the LaTeX.
             # We also sanitize non-ASCII characters (like Kanji) to prevent listings package errors.
             try:
-                with open(os.path.abspath(__file__), "r") as source_file:
-                    for line in source_file:
-                        safe_line = ""
-                        for char in line:
-                            if ord(char) > 127:
-                                safe_line += f"<U+{ord(char):X}>"
-                            else:
-                                safe_line += char
-                        f.write(safe_line)
+                with open(os.path.abspath(__file__), "r", encoding="utf-8") as source_file:
+                    emit(NON_ASCII_RE.sub(lambda m: f"<U+{ord(m.group()):X}>", source_file.read()))
             except Exception as e:
-                f.write(f"# Error reading source code: {e}")
+                emit(f"# Error reading source code: {e}")
             
-            # Safe way to write the end tag without breaking the listing
-            f.write(r"\end{lst" + "listing}" + "\n")
-            f.write(r"\end{multicols*}" + "\n")
-            f.write(r"\end{landscape}" + "\n")
+            emit(SOURCE_APPENDIX_END)
             
-        f.write(r"\end{CJK*}" + "\n")
-        f.write(r"\end{document}")
+        emit(r"\end{CJK*}" + "\n")
+        emit(r"\end{document}")
+
+        flush(f)
 
     print(f"Generated: {output_tex}")
     print(f"Configuration: Paper={CURRENT_PAPER_KEY} ({PAGE_W}x{PAGE_H}mm)")
@@ -1738,27 +1795,57 @@ def generate_tex(test_mode=False, spread_mode="2up", align_mode="mirrored", no_c
                     pdflatex_path,
                     f"-output-directory={OUTPUT_DIR}",
                     "-interaction=nonstopmode", # Don't hang on errors
+                    "-file-line-error",
+                    "-synctex=0", # No editor sync data for a generated document
                     output_tex
                 ]
+                # First pass only needs the .aux (ToC, page refs, TikZ positions), not the PDF
+                cmd_draft = cmd[:1] + ["-draftmode"] + cmd[1:]
+
+                # pdflatex output is discarded (it is all in the .log) so the run never
+                # blocks on terminal writes
+                def run_pass(pass_cmd):
+                    subprocess.run(pass_cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+                # References and TikZ positions from the previous run, if any
+                aux_path = os.path.join(OUTPUT_DIR, output_base + ".aux")
+                def read_aux():
+                    try:
+                        with open(aux_path, "rb") as aux_file:
+                            return aux_file.read()
+                    except OSError:
+                        return None
                 
                 if single_pass:
                     print("Compiling (Single Pass)...")
                     print("Warning: ToC and Edge Index may be incorrect due to missing second pass.")
-                    subprocess.run(cmd, check=True)
+                    run_pass(cmd)
                 else:
-                    # Always run twice.
+                    # Two passes are needed to resolve
                     # 1. ToC references (if enabled)
                     # 2. TikZ [remember picture, overlay] for Edge Indexing (always enabled)
-                    print("Pass 1/2...")
-                    subprocess.run(cmd, check=True)
-                    
-                    print("Pass 2/2 (Resolving references & overlays)...")
-                    subprocess.run(cmd, check=True)
+                    prev_aux = read_aux()
+                    if prev_aux is None:
+                        print("Pass 1/2 (draft)...")
+                        run_pass(cmd_draft)
+                        
+                        print("Pass 2/2 (Resolving references & overlays)...")
+                        run_pass(cmd)
+                    else:
+                        # Re-run with an existing .aux: if this pass leaves it unchanged, the
+                        # references it used were already final and no second pass is needed
+                        print("Pass 1 (Reusing references & overlays from the previous run)...")
+                        run_pass(cmd)
+                        
+                        if read_aux() != prev_aux:
+                            print("Pass 2 (References changed, resolving again)...")
+                            run_pass(cmd)
                 
                 print(f"Success! PDF generated at: {os.path.join(OUTPUT_DIR, output_base + '.pdf')}")
             except subprocess.CalledProcessError as e:
                 print("Error during PDF compilation.")
                 print(e)
+                print(f"See the log for details: {os.path.join(OUTPUT_DIR, output_base + '.log')}")
         else:
             print("\n[NOTICE] pdflatex not found in PATH.")
             print("To generate the PDF, please install a LaTeX distribution (e.g., TeX Live, MacTeX).")